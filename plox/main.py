@@ -8,10 +8,11 @@ if __name__ == "__main__":
 
     parser = ArgumentParser(prog="pLox", description="Interpreter for the language 'Lox' implemented in Python", epilog="- Florian Heringa 2025")
     parser.add_argument("files", nargs="*")
+    parser.add_argument("--vm", action="store_true", help="Run on the bytecode VM instead of the tree-walking interpreter")
 
     args = parser.parse_args()
 
-    lox = Lox()
+    lox = Lox(use_vm=args.vm)
 
     if len(args.files) == 0:
         lox.runPrompt()
@@ -14,6 +14,9 @@ class AstPrinter(Visitor):
     
     def visitLiteralExpr(self, expr: Literal) -> Any:
         if (expr.value == None): return "nil"
+        # Use the form the parser precomputed when available
+        cached = getattr(expr, "str_cached", None)
+        if cached is not None: return cached
         return f"{expr.value:g}"
     
     def visitUnaryExpr(self, expr: Unary) -> Any:
@@ -9,6 +9,7 @@ from ..token import Token
 T = TypeVar("T")
 
 class Visitor(ABC, Generic[T]):
+	__slots__ = ()
 	@abstractmethod
 	def visitAssignExpr(self, expr: "Assign") -> T: ...
 	@abstractmethod
@@ -34,13 +35,16 @@ class Visitor(ABC, Generic[T]):
 	@abstractmethod
 	def visitVariableExpr(self, expr: "Variable") -> T: ...
 
-# Required to be frozen and eq since they are used as keys in dicts and need to be hashable
+# Nodes are slotted: no per-instance __dict__, fields are direct slot reads.
+# The base class reserves slots for annotations attached after construction.
 @dataclass(eq=True, frozen=True)
 class Expr:
+	__slots__ = ("str_cached", "_methodCache", "numeric_fast", "resolved", "op_fn", "fused_delta",)
+
 	@abstractmethod
 	def accept(self, visitor: Visitor) -> Any: ...
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Assign(Expr):
 	name: Token
 	value: Expr
@@ -48,7 +52,7 @@ class Assign(Expr):
 	def accept(self, visitor: Visitor) -> Any:
 		return visitor.visitAssignExpr(self)
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Binary(Expr):
 	left: Expr
 	operator: Token
@@ -57,7 +61,7 @@ class Binary(Expr):
 	def accept(self, visitor: Visitor) -> Any:
 		return visitor.visitBinaryExpr(self)
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Call(Expr):
 	callee: Expr
 	paren: Token
@@ -66,7 +70,7 @@ class Call(Expr):
 	def accept(self, visitor: Visitor) -> Any:
 		return visitor.visitCallExpr(self)
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Get(Expr):
 	object: Expr
 	name: Token
@@ -74,21 +78,21 @@ class Get(Expr):
 	def accept(self, visitor: Visitor) -> Any:
 		return visitor.visitGetExpr(self)
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Grouping(Expr):
 	expression: Expr
 
 	def accept(self, visitor: Visitor) -> Any:
 		return visitor.visitGroupingExpr(self)
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Literal(Expr):
 	value: object
 
 	def accept(self, visitor: Visitor) -> Any:
 		return visitor.visitLiteralExpr(self)
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Logical(Expr):
 	left: Expr
 	operator: Token
@@ -97,7 +101,7 @@ class Logical(Expr):
 	def accept(self, visitor: Visitor) -> Any:
 		return visitor.visitLogicalExpr(self)
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Set(Expr):
 	object: Expr
 	name: Token
@@ -106,7 +110,7 @@ class Set(Expr):
 	def accept(self, visitor: Visitor) -> Any:
 		return visitor.visitSetExpr(self)
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Super(Expr):
 	keyword: Token
 	method: Token
@@ -114,14 +118,14 @@ class Super(Expr):
 	def accept(self, visitor: Visitor) -> Any:
 		return visitor.visitSuperExpr(self)
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class This(Expr):
 	keyword: Token
 
 	def accept(self, visitor: Visitor) -> Any:
 		return visitor.visitThisExpr(self)
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Unary(Expr):
 	operator: Token
 	right: Expr
@@ -129,7 +133,7 @@ class Unary(Expr):
 	def accept(self, visitor: Visitor) -> Any:
 		return visitor.visitUnaryExpr(self)
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Variable(Expr):
 	name: Token
 
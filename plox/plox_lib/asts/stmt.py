@@ -10,6 +10,7 @@ from .expr import Expr, Variable
 T = TypeVar("T")
 
 class Visitor(ABC, Generic[T]):
+	__slots__ = ()
 	@abstractmethod
 	def visitBlockStmt(self, stmt: "Block") -> T: ...
 	@abstractmethod
@@ -29,20 +30,23 @@ class Visitor(ABC, Generic[T]):
 	@abstractmethod
 	def visitWhileStmt(self, stmt: "While") -> T: ...
 
-# Required to be frozen and eq since they are used as keys in dicts and need to be hashable
+# Nodes are slotted: no per-instance __dict__, fields are direct slot reads.
+# The base class reserves slots for annotations attached after construction.
 @dataclass(eq=True, frozen=True)
 class Stmt:
+	__slots__ = ("num_locals", "slot", "_loop_fn",)
+
 	@abstractmethod
 	def accept(self, visitor: Visitor) -> Any: ...
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Block(Stmt):
 	statements: list[Stmt]
 
 	def accept(self, visitor: Visitor) -> Any:
 		return visitor.visitBlockStmt(self)
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Class(Stmt):
 	name: Token
 	superclass: Variable | None
@@ -51,14 +55,14 @@ class Class(Stmt):
 	def accept(self, visitor: Visitor) -> Any:
 		return visitor.visitClassStmt(self)
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Expression(Stmt):
 	expression: Expr
 
 	def accept(self, visitor: Visitor) -> Any:
 		return visitor.visitExpressionStmt(self)
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Function(Stmt):
 	name: Token
 	params: list[Token]
@@ -67,7 +71,7 @@ class Function(Stmt):
 	def accept(self, visitor: Visitor) -> Any:
 		return visitor.visitFunctionStmt(self)
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class If(Stmt):
 	condition: Expr
 	thenBranch: Stmt
@@ -76,14 +80,14 @@ class If(Stmt):
 	def accept(self, visitor: Visitor) -> Any:
 		return visitor.visitIfStmt(self)
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Print(Stmt):
 	expression: Expr
 
 	def accept(self, visitor: Visitor) -> Any:
 		return visitor.visitPrintStmt(self)
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Return(Stmt):
 	keyword: Token
 	value: Expr | None
@@ -91,7 +95,7 @@ class Return(Stmt):
 	def accept(self, visitor: Visitor) -> Any:
 		return visitor.visitReturnStmt(self)
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Var(Stmt):
 	name: Token
 	initializer: Expr | None
@@ -99,7 +103,7 @@ class Var(Stmt):
 	def accept(self, visitor: Visitor) -> Any:
 		return visitor.visitVarStmt(self)
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class While(Stmt):
 	condition: Expr
 	body: Stmt
@@ -0,0 +1,294 @@
+from .asts.expr import Expr, Binary, Grouping, Literal, Unary, Variable, Assign, Call
+from .asts.stmt import Stmt, Expression, Print, Var, Block, If, While, Function, Return
+from .token_type import TokenType
+from .token import Token
+from .error import LoxCompileError
+
+# For distinguishing the different Visitor implementations
+from .asts import expr, stmt
+
+# Opcodes for the bytecode VM. Plain ints so the dispatch loop in vm.py can
+# 'match' on small integers instead of enum members.
+OP_LOAD_CONST    = 0   # operand: constant index
+OP_NIL           = 1
+OP_LOAD_LOCAL    = 2   # operands: depth, slot
+OP_STORE_LOCAL   = 3   # operands: depth, slot
+OP_DEFINE_LOCAL  = 4   # appends top of stack as the next slot in the current scope
+OP_GET_GLOBAL    = 5   # operands: name index, token index
+OP_SET_GLOBAL    = 6   # operands: name index, token index
+OP_DEFINE_GLOBAL = 7   # operand: name index
+OP_ADD           = 8   # operand: token index (all arithmetic carries one for errors)
+OP_SUB           = 9
+OP_MUL           = 10
+OP_DIV           = 11
+OP_LT            = 12
+OP_LE            = 13
+OP_GT            = 14
+OP_GE            = 15
+OP_EQ            = 16
+OP_NEQ           = 17
+OP_NEGATE        = 18
+OP_NOT           = 19
+OP_JUMP          = 20  # operand: absolute target
+OP_JUMP_IF_FALSE = 21  # operand: absolute target, pops the condition
+OP_JUMP_IF_FALSE_NP = 22  # operand: absolute target, leaves the condition on the stack
+OP_POP           = 23
+OP_PRINT         = 24
+OP_PUSH_SCOPE    = 25
+OP_POP_SCOPE     = 26
+OP_MAKE_FUNCTION = 27  # operand: constant index of the Chunk to close over
+OP_CALL          = 28  # operands: argument count, token index
+OP_RETURN        = 29
+
+
+class Chunk:
+    """A compiled function body: flat opcode list plus parallel constant/name/token tables."""
+
+    def __init__(self, name: str, arity: int = 0):
+        self.name: str = name
+        self.arity: int = arity
+        self.code: list[int] = []
+        self.consts: list[object] = []
+        self.names: list[str] = []
+        self.tokens: list[Token] = []
+
+    def emit(self, *ops: int) -> int:
+        """Append instruction words, returning the offset of the first one."""
+        offset = len(self.code)
+        self.code.extend(ops)
+        return offset
+
+    def addConst(self, value: object) -> int:
+        self.consts.append(value)
+        return len(self.consts) - 1
+
+    def addName(self, name: str) -> int:
+        if name in self.names:
+            return self.names.index(name)
+        self.names.append(name)
+        return len(self.names) - 1
+
+    def addToken(self, token: Token) -> int:
+        self.tokens.append(token)
+        return len(self.tokens) - 1
+
+
+# Binary operator token => opcode. EQUAL_EQUAL/BANG_EQUAL and PLUS keep their
+# dynamic typing behaviour in the VM itself.
+BINARY_OPS: dict[TokenType, int] = {
+    TokenType.PLUS: OP_ADD,
+    TokenType.MINUS: OP_SUB,
+    TokenType.STAR: OP_MUL,
+    TokenType.SLASH: OP_DIV,
+    TokenType.LESS: OP_LT,
+    TokenType.LESS_EQUAL: OP_LE,
+    TokenType.GREATER: OP_GT,
+    TokenType.GREATER_EQUAL: OP_GE,
+    TokenType.EQUAL_EQUAL: OP_EQ,
+    TokenType.BANG_EQUAL: OP_NEQ,
+}
+
+
+class Compiler(expr.Visitor[None], stmt.Visitor[None]):
+    """
+    One-shot AST => bytecode compiler. Walks the tree once and emits a flat
+    opcode stream, so the VM pays a list index + int compare per operation
+    instead of a method call and attribute lookups per AST node.
+
+    Variables are resolved at compile time to (depth, slot) pairs into the
+    runtime scope chain; names that are not found in any lexical scope compile
+    to global-by-name instructions.
+
+    Classes (and 'this'/'super'/property access) are not supported yet; those
+    constructs raise LoxCompileError so the caller can fall back to the
+    tree-walking Interpreter.
+    """
+
+    def __init__(self):
+        self.chunk: Chunk = Chunk("<script>")
+        # Stack of lexical scopes; each scope is the ordered list of local
+        # names declared in it, mirroring the VM's runtime scope chain.
+        self.scopes: list[list[str]] = []
+
+    def compile(self, statements: list[Stmt]) -> Chunk:
+        for statement in statements:
+            statement.accept(self)
+        self.chunk.emit(OP_NIL, OP_RETURN)
+        return self.chunk
+
+    ############################ Variable resolution
+
+    def resolveLocal(self, name: str) -> tuple[int, int] | None:
+        """Find a declared local, returning (depth up the scope chain, slot index)."""
+        for depth in range(len(self.scopes)):
+            scope = self.scopes[-1 - depth]
+            if name in scope:
+                return depth, scope.index(name)
+        return None
+
+    def emitLoad(self, name: Token):
+        resolved = self.resolveLocal(name.lexeme)
+        if resolved is not None:
+            self.chunk.emit(OP_LOAD_LOCAL, resolved[0], resolved[1])
+        else:
+            self.chunk.emit(OP_GET_GLOBAL, self.chunk.addName(name.lexeme), self.chunk.addToken(name))
+
+    def emitStore(self, name: Token):
+        resolved = self.resolveLocal(name.lexeme)
+        if resolved is not None:
+            self.chunk.emit(OP_STORE_LOCAL, resolved[0], resolved[1])
+        else:
+            self.chunk.emit(OP_SET_GLOBAL, self.chunk.addName(name.lexeme), self.chunk.addToken(name))
+
+    ############################ expr.Visitor implementation
+
+    def visitLiteralExpr(self, expr: Literal) -> None:
+        self.chunk.emit(OP_LOAD_CONST, self.chunk.addConst(expr.value))
+
+    def visitGroupingExpr(self, expr: Grouping) -> None:
+        expr.expression.accept(self)
+
+    def visitUnaryExpr(self, expr: Unary) -> None:
+        expr.right.accept(self)
+        if expr.operator.token_type == TokenType.MINUS:
+            self.chunk.emit(OP_NEGATE, self.chunk.addToken(expr.operator))
+        else:
+            self.chunk.emit(OP_NOT)
+
+    def visitBinaryExpr(self, expr: Binary) -> None:
+        expr.left.accept(self)
+        expr.right.accept(self)
+        self.chunk.emit(BINARY_OPS[expr.operator.token_type], self.chunk.addToken(expr.operator))
+
+    def visitLogicalExpr(self, expr: expr.Logical) -> None:
+        expr.left.accept(self)
+        if expr.operator.token_type == TokenType.OR:
+            # value falsey => evaluate rhs, otherwise keep lhs
+            overRhs = self.chunk.emit(OP_JUMP_IF_FALSE_NP, 0)
+            end = self.chunk.emit(OP_JUMP, 0)
+            self.chunk.code[overRhs + 1] = len(self.chunk.code)
+            self.chunk.emit(OP_POP)
+            expr.right.accept(self)
+            self.chunk.code[end + 1] = len(self.chunk.code)
+        else:
+            # value falsey => keep lhs, otherwise evaluate rhs
+            end = self.chunk.emit(OP_JUMP_IF_FALSE_NP, 0)
+            self.chunk.emit(OP_POP)
+            expr.right.accept(self)
+            self.chunk.code[end + 1] = len(self.chunk.code)
+
+    def visitVariableExpr(self, expr: Variable) -> None:
+        self.emitLoad(expr.name)
+
+    def visitAssignExpr(self, expr: Assign) -> None:
+        expr.value.accept(self)
+        self.emitStore(expr.name)
+
+    def visitCallExpr(self, expr: Call) -> None:
+        expr.callee.accept(self)
+        for argument in expr.arguments:
+            argument.accept(self)
+        self.chunk.emit(OP_CALL, len(expr.arguments), self.chunk.addToken(expr.paren))
+
+    def visitGetExpr(self, expr: expr.Get) -> None:
+        raise LoxCompileError("Property access is not supported by the bytecode VM yet.")
+
+    def visitSetExpr(self, expr: expr.Set) -> None:
+        raise LoxCompileError("Property access is not supported by the bytecode VM yet.")
+
+    def visitThisExpr(self, expr: expr.This) -> None:
+        raise LoxCompileError("Classes are not supported by the bytecode VM yet.")
+
+    def visitSuperExpr(self, expr: expr.Super) -> None:
+        raise LoxCompileError("Classes are not supported by the bytecode VM yet.")
+
+    ############################ stmt.Visitor implementation
+
+    def visitExpressionStmt(self, stmt: Expression) -> None:
+        stmt.expression.accept(self)
+        self.chunk.emit(OP_POP)
+
+    def visitPrintStmt(self, stmt: Print) -> None:
+        stmt.expression.accept(self)
+        self.chunk.emit(OP_PRINT)
+
+    def visitVarStmt(self, stmt: Var) -> None:
+        if stmt.initializer is not None:
+            stmt.initializer.accept(self)
+        else:
+            self.chunk.emit(OP_NIL)
+        if self.scopes:
+            scope = self.scopes[-1]
+            if stmt.name.lexeme in scope:
+                # resolveLocal maps a name to its first slot, so a second
+                # declaration would get its own slot but never be read back.
+                # Bail out to the tree-walker, whose Resolver reports this.
+                raise LoxCompileError(f"Variable '{stmt.name.lexeme}' is already declared in this scope.")
+            scope.append(stmt.name.lexeme)
+            self.chunk.emit(OP_DEFINE_LOCAL)
+        else:
+            self.chunk.emit(OP_DEFINE_GLOBAL, self.chunk.addName(stmt.name.lexeme))
+
+    def visitBlockStmt(self, stmt: Block) -> None:
+        self.chunk.emit(OP_PUSH_SCOPE)
+        self.scopes.append([])
+        for statement in stmt.statements:
+            statement.accept(self)
+        self.scopes.pop()
+        self.chunk.emit(OP_POP_SCOPE)
+
+    def visitIfStmt(self, stmt: If) -> None:
+        stmt.condition.accept(self)
+        toElse = self.chunk.emit(OP_JUMP_IF_FALSE, 0)
+        stmt.thenBranch.accept(self)
+        toEnd = self.chunk.emit(OP_JUMP, 0)
+        self.chunk.code[toElse + 1] = len(self.chunk.code)
+        if stmt.elseBranch is not None:
+            stmt.elseBranch.accept(self)
+        self.chunk.code[toEnd + 1] = len(self.chunk.code)
+
+    def visitWhileStmt(self, stmt: While) -> None:
+        loopStart = len(self.chunk.code)
+        stmt.condition.accept(self)
+        toEnd = self.chunk.emit(OP_JUMP_IF_FALSE, 0)
+        stmt.body.accept(self)
+        self.chunk.emit(OP_JUMP, loopStart)
+        self.chunk.code[toEnd + 1] = len(self.chunk.code)
+
+    def visitFunctionStmt(self, stmt: Function) -> None:
+        enclosing = self.chunk
+        self.chunk = Chunk(stmt.name.lexeme, arity=len(stmt.params))
+
+        # Declare the function in the enclosing scope *before* compiling the
+        # body so recursive references resolve, matching the tree-walker.
+        if self.scopes:
+            scope = self.scopes[-1]
+            if stmt.name.lexeme in scope:
+                # Same first-slot aliasing problem as visitVarStmt
+                raise LoxCompileError(f"Variable '{stmt.name.lexeme}' is already declared in this scope.")
+            scope.append(stmt.name.lexeme)
+
+        # Parameters live in the scope the VM pushes on call
+        self.scopes.append([param.lexeme for param in stmt.params])
+        for statement in stmt.body:
+            statement.accept(self)
+        self.chunk.emit(OP_NIL, OP_RETURN)
+        self.scopes.pop()
+
+        function = self.chunk
+        self.chunk = enclosing
+        self.chunk.emit(OP_MAKE_FUNCTION, self.chunk.addConst(function))
+        if self.scopes:
+            self.chunk.emit(OP_DEFINE_LOCAL)
+        else:
+            self.chunk.emit(OP_DEFINE_GLOBAL, self.chunk.addName(stmt.name.lexeme))
+
+    def visitReturnStmt(self, stmt: stmt.Return) -> None:
+        if stmt.value is not None:
+            stmt.value.accept(self)
+        else:
+            self.chunk.emit(OP_NIL)
+        self.chunk.emit(OP_RETURN)
+
+    def visitClassStmt(self, stmt: stmt.Class) -> None:
+        raise LoxCompileError("Classes are not supported by the bytecode VM yet.")
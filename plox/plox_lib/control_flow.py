@@ -1,6 +0,0 @@
-
-
-class Return(Exception):
-
-    def __init__(self, value):
-        self.value = value
\ No newline at end of file
@@ -1,18 +1,33 @@
 from .token import Token
-from .error import LoxRuntimeError, LoxVariableAccessError
+from .error import LoxRuntimeError
 
 class Environment:
 
-    def __init__(self, enclosing: "Environment | None" = None):
+    __slots__ = ("slots", "values", "enclosing", "chain")
+
+    def __init__(self, enclosing: "Environment | None" = None, size: int = 0):
+        # Resolved locals live in indexed slots; the Resolver assigns the indices
+        # and pre-computes the scope size, so the whole list is allocated in one
+        # go instead of growing by repeated appends. The name-keyed dict is only
+        # used for global (unresolved) bindings.
+        self.slots: list[object] = [None] * size
         self.values: dict[str, object] = {}
         self.enclosing: Environment | None = enclosing
+        # Display: chain[d] is the d-th lexical ancestor (chain[0] is self), built
+        # once at construction so getAt/assignAt index instead of walking pointers.
+        if enclosing is None:
+            self.chain: list[Environment] = [self]
+        else:
+            self.chain = [self, *enclosing.chain]
 
     def __str__(self) -> str:
-        return f"{self.values} => {self.enclosing}"
+        return f"{self.slots} | {self.values} => {self.enclosing}"
 
     def define(self, name: str, value: object):
-        """ 
-        The way this function works allows for redefinition of variables. 
+        """
+        Define a binding by name; used for the global scope where variables are
+        not resolved to slots.
+        The way this function works allows for redefinition of variables.
         According to the book this choice is because it interacts poorly with the REPL.
         Because remembering all defined variables might be tough.
         If I expand the REPL feature set, I plan to include vartiable lookup and overview.
@@ -20,6 +35,14 @@ class Environment:
         """
         self.values[name] = value
 
+    def defineSlot(self, value: object):
+        """
+        Define the next local in this scope. The Resolver assigns slot indices in
+        declaration order, so appending keeps the runtime slots aligned with the
+        indices it hands to the Interpreter.
+        """
+        self.slots.append(value)
+
     def  get(self, name: Token) -> object:
         """
         It is an error if a variable is undefined at the moment a value is requested.
@@ -31,20 +54,11 @@ class Environment:
         if self.enclosing is not None:
             return self.enclosing.get(name)
         raise LoxRuntimeError(name, f"Undefined variable '{name.lexeme}'.")
-    
-    def getAt(self, name: str, depth: int) -> object:
-        """Same as 'get', but a certain distance (depth) up the ineritance chain of environments."""
-        return self.ancestor(depth).values.get(name)
-    
-    def ancestor(self, distance: int) -> "Environment":
-        env: Environment = self
-        # Walk up the scope chain for anumber of steps
-        for i in range(distance):
-            if env.enclosing is None:
-                raise LoxVariableAccessError("Top level reached without finding variable <THIS IS A BUG>")
-            env = env.enclosing
-        return env
-    
+
+    def getAt(self, depth: int, slot: int) -> object:
+        """Read a resolved local: a certain distance (depth) up the chain of environments, by slot index."""
+        return self.chain[depth].slots[slot]
+
     def assign(self, name: Token, value: object):
         """
         Assign a loxValue to a specified name. The input of this function is a token so we can do proper error reporting (including line number).
@@ -57,6 +71,6 @@ class Environment:
             self.enclosing.assign(name, value)
             return
         raise LoxRuntimeError(name, f"Undefined variable '{name.lexeme}'.")
-    
-    def assignAt(self, distance: int, name: Token, value: object):
-        self.ancestor(distance).values[name.lexeme] = value
+
+    def assignAt(self, depth: int, slot: int, value: object):
+        self.chain[depth].slots[slot] = value
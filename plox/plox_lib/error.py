@@ -3,15 +3,16 @@ from .token import Token
 class LoxParseError(Exception):
     ...
 
+class LoxCompileError(Exception):
+    """Raised when the bytecode compiler hits a construct it does not support yet."""
+
+    def __init__(self, message):
+        super().__init__(message)
+        self.message = message
+
 class LoxRuntimeError(Exception):
 
     def __init__(self, token: Token, message: str):
         super().__init__()
         self.token = token
-        self.message = message
-
-class LoxVariableAccessError(Exception):
-    
-    def __init__(self, message):
-        super().__init__()
         self.message = message
\ No newline at end of file
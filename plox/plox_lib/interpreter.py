@@ -9,7 +9,7 @@ from .lox_function import LoxFunction
 from .lox_class import LoxClass
 from .lox_instance import LoxInstance
 
-from . import control_flow
+from . import loop_jit
 
 # Circumvent circular import with lox.py
 from . import lox
@@ -18,36 +18,116 @@ from .asts import expr, stmt
 
 import time
 
+class Clock(LoxCallable):
+    """The clock() builtin. Defined once at module scope so every interpreter
+    shares one class (and instance) and type identity stays stable for JITs."""
+
+    def arity(self) -> int:
+        return 0
+
+    def call(self, interpreter: "Interpreter", arguments: list[object]) -> object:
+        return int(time.time_ns() / 1_000_000)
+
+    def __repr__(self) -> str:
+        return f"<fn clock (builtin)>"
+
+_CLOCK = Clock()
+
+# Raw int values of the operator tokens compared in the hot path; with TokenType
+# an IntEnum, int == int is a single C-level compare.
+_TT_OR: int = TokenType.OR.value
+_TT_MINUS: int = TokenType.MINUS.value
+_TT_BANG: int = TokenType.BANG.value
+
+
+def isTruthy(value: object) -> bool:
+    """
+    Check if the value is truthy. This is defined as:
+    falsey => {False, nil}
+    truthy => {everything else}
+    (this is the same as in Ruby)
+    Only nil and false are falsey, so two pointer compares suffice; a plain
+    function rather than a method since it runs per if/while/and/or iteration.
+    """
+    return value is not None and value is not False
+
+
+def isEqual(a: object, b: object) -> bool:
+    """Test equality between two object values, in one short-circuiting expression"""
+    return a is b or (a is not None and b is not None and a == b)
+
 class Interpreter(expr.Visitor[object], stmt.Visitor[None]):
 
     globals: Environment = Environment()
 
     def __init__(self):
         self.env: Environment = Interpreter.globals
-        self.locals: dict[Expr, int] = {}
 
-        class Clock(LoxCallable):
-            def arity(self) -> int:
-                return 0
-
-            def call(self, interpreter: Interpreter, arguments: list[object]) -> object:
-                return int(time.time_ns() / 1_000_000)
-            
-            def __repr__(self) -> str:
-                return f"<fn clock (builtin)>"
-
-        Interpreter.globals.define("clock", Clock())
+        if "clock" not in Interpreter.globals.values:
+            Interpreter.globals.define("clock", _CLOCK)
+
+        # Set by visitReturnStmt and consumed by LoxFunction.call; the statement
+        # loops break out as soon as the flag goes up
+        self._returning: bool = False
+        self._return_value: object = None
+
+        # Operator => bound handler, built once per interpreter. Stored as a
+        # tuple indexed by the raw token-type int: tuple indexing is the
+        # fastest dispatch pure Python has, beating a dict probe.
+        handlers: list = [None] * (max(TokenType).value + 1)
+        handlers[TokenType.MINUS] = self.binarySub
+        handlers[TokenType.STAR] = self.binaryMul
+        handlers[TokenType.SLASH] = self.binaryDiv
+        handlers[TokenType.GREATER] = self.binaryGreater
+        handlers[TokenType.GREATER_EQUAL] = self.binaryGreaterEqual
+        handlers[TokenType.LESS] = self.binaryLess
+        handlers[TokenType.LESS_EQUAL] = self.binaryLessEqual
+        handlers[TokenType.EQUAL_EQUAL] = self.binaryEqual
+        handlers[TokenType.BANG_EQUAL] = self.binaryNotEqual
+        handlers[TokenType.PLUS] = self.binaryAdd
+        self.binaryHandlers: tuple = tuple(handlers)
+
+        # Node type => bound handler. evaluate/execute dispatch through one dict
+        # probe on type(node) instead of the accept() double dispatch, which costs
+        # an extra Python method call per node. Other passes (Resolver, printers)
+        # still go through accept().
+        self._expr_dispatch = {
+            Literal: self.visitLiteralExpr,
+            expr.Logical: self.visitLogicalExpr,
+            Grouping: self.visitGroupingExpr,
+            Unary: self.visitUnaryExpr,
+            Binary: self.visitBinaryExpr,
+            Call: self.visitCallExpr,
+            expr.Get: self.visitGetExpr,
+            expr.Set: self.visitSetExpr,
+            expr.Super: self.visitSuperExpr,
+            expr.This: self.visitThisExpr,
+            Variable: self.visitVariableExpr,
+            Assign: self.visitAssignExpr,
+        }
+
+        self._stmt_dispatch = {
+            Expression: self.visitExpressionStmt,
+            Function: self.visitFunctionStmt,
+            If: self.visitIfStmt,
+            Print: self.visitPrintStmt,
+            Return: self.visitReturnStmt,
+            Var: self.visitVarStmt,
+            Block: self.visitBlockStmt,
+            stmt.Class: self.visitClassStmt,
+            While: self.visitWhileStmt,
+        }
 
     def interpret(self, statements: list[Stmt]) -> object:
         try:
             for stmt in statements:
                 self.execute(stmt)
         except LoxRuntimeError as err:
+            # Don't leak a pending return into the next REPL statement
+            self._returning = False
+            self._return_value = None
             lox.Lox.runtimeError(err)
 
-    def resolve(self, expr: Expr, depth: int):
-        self.locals[expr] = depth
-
     ############################ Visitor pattern implementation
 
     def visitLiteralExpr(self, expr: Literal) -> object:
@@ -61,10 +141,10 @@ class Interpreter(expr.Visitor[object], stmt.Visitor[None]):
         a and b => when a is false, don't evaluate b return a, otherwise return b
         """
         left: object = self.evaluate(expr.left)
-        if expr.operator.token_type == TokenType.OR:
-            return left if self.isTruthy(left) else self.evaluate(expr.right)
+        if expr.operator.token_type == _TT_OR:
+            return left if isTruthy(left) else self.evaluate(expr.right)
         else:
-            return left if not self.isTruthy(left) else self.evaluate(expr.right)
+            return left if not isTruthy(left) else self.evaluate(expr.right)
         
     
     def visitGroupingExpr(self, expr: Grouping) -> object:
@@ -75,60 +155,83 @@ class Interpreter(expr.Visitor[object], stmt.Visitor[None]):
         """First evfaluate the contained expression, then apply the unary operator"""
         right: object = self.evaluate(expr.right)
 
-        match expr.operator.token_type:
-            case TokenType.MINUS:
-                # TODO: fix this type checking issue. Maybe define some helper functions in utils.py
-                self.checkNumberOperand(expr.operator, right)
-                return -float(right) # type: ignore
-            case TokenType.BANG:
-                return not self.isTruthy(right)
-            
+        # Plain comparisons; a match statement here compiles to sequential Enum
+        # equality tests on every evaluation (and only CPython 3.11+ optimizes it)
+        token_type: int = expr.operator.token_type
+        if token_type == _TT_MINUS:
+            # TODO: fix this type checking issue. Maybe define some helper functions in utils.py
+            self.checkNumberOperand(expr.operator, right)
+            return -right # type: ignore
+        if token_type == _TT_BANG:
+            return not isTruthy(right)
+
         return None
 
     def visitBinaryExpr(self, expr: Binary) -> object:
         """Holds two expressions inside that must be evaluated, together with the operator in between"""
-        left: object = self.evaluate(expr.left)
-        right: object = self.evaluate(expr.right)
+        # One attribute lookup for the two recursive calls
+        evaluate = self.evaluate
+        left: object = evaluate(expr.left)
+        right: object = evaluate(expr.right)
+
+        # Nodes the parser proved numeric-only skip the type gate and operand
+        # checks; the parser also pre-selected the unchecked handler, so this is
+        # one slot read and a direct call
+        if getattr(expr, "numeric_fast", False):
+            return expr.op_fn(left, right)
 
         if not isinstance(left, (float, str, bool)) or not isinstance(right, (float, str, bool)):
             return None
 
-        match expr.operator.token_type:
-            case TokenType.MINUS:
-                self.checkNumberOperands(expr.operator, left, right)
-                return float(left) - float(right)
-            case TokenType.STAR:
-                self.checkNumberOperands(expr.operator, left, right)
-                return float(left) * float(right)
-            case TokenType.SLASH:
-                self.checkNumberOperands(expr.operator, left, right)
-                return float(left) / float(right)
-            case TokenType.GREATER:
-                self.checkNumberOperands(expr.operator, left, right)
-                return float(left) > float(right)
-            case TokenType.GREATER_EQUAL:
-                self.checkNumberOperands(expr.operator, left, right)
-                return float(left) >= float(right)
-            case TokenType.LESS:
-                self.checkNumberOperands(expr.operator, left, right)
-                return float(left) < float(right)
-            case TokenType.LESS_EQUAL:
-                self.checkNumberOperands(expr.operator, left, right)
-                return float(left) <= float(right)
-            case TokenType.EQUAL_EQUAL:
-                return self.isEqual(left, right)
-            case TokenType.BANG_EQUAL:
-                return not self.isEqual(left, right)
-            case TokenType.PLUS:
-                if isinstance(left, float) and isinstance(right, float):
-                    return float(left) + float(right)
-                elif isinstance(left, str) and isinstance(right, str):
-                    return str(left) + str(right)
-                # Allow mixed expressions and interpret as strings
-                elif isinstance(left, (float, int, str)) and isinstance(right, (float, int, str)):
-                    return str(left) + str(right)
-                raise LoxRuntimeError(expr.operator, "Operands must be two numbers or two strings")
-            
+        # One dict probe into the handler table instead of walking a 10-arm match per evaluation
+        return self.binaryHandlers[expr.operator.token_type](expr.operator, left, right)
+
+    ######################## Binary operator handlers
+
+    def binarySub(self, operator: Token, left: object, right: object) -> object:
+        self.checkNumberOperands(operator, left, right)
+        return left - right  # type: ignore
+
+    def binaryMul(self, operator: Token, left: object, right: object) -> object:
+        self.checkNumberOperands(operator, left, right)
+        return left * right  # type: ignore
+
+    def binaryDiv(self, operator: Token, left: object, right: object) -> object:
+        self.checkNumberOperands(operator, left, right)
+        return left / right  # type: ignore
+
+    def binaryGreater(self, operator: Token, left: object, right: object) -> object:
+        self.checkNumberOperands(operator, left, right)
+        return left > right  # type: ignore
+
+    def binaryGreaterEqual(self, operator: Token, left: object, right: object) -> object:
+        self.checkNumberOperands(operator, left, right)
+        return left >= right  # type: ignore
+
+    def binaryLess(self, operator: Token, left: object, right: object) -> object:
+        self.checkNumberOperands(operator, left, right)
+        return left < right  # type: ignore
+
+    def binaryLessEqual(self, operator: Token, left: object, right: object) -> object:
+        self.checkNumberOperands(operator, left, right)
+        return left <= right  # type: ignore
+
+    def binaryEqual(self, operator: Token, left: object, right: object) -> object:
+        return isEqual(left, right)
+
+    def binaryNotEqual(self, operator: Token, left: object, right: object) -> object:
+        return not isEqual(left, right)
+
+    def binaryAdd(self, operator: Token, left: object, right: object) -> object:
+        if type(left) is float is type(right):
+            return left + right
+        elif type(left) is str is type(right):
+            return left + right
+        # Allow mixed expressions and interpret as strings
+        elif isinstance(left, (float, int, str)) and isinstance(right, (float, int, str)):
+            return str(left) + str(right)
+        raise LoxRuntimeError(operator, "Operands must be two numbers or two strings")
+
     def visitCallExpr(self, expr: Call) -> object:
 
         callee: object = self.evaluate(expr.callee)
@@ -148,9 +251,39 @@ class Interpreter(expr.Visitor[object], stmt.Visitor[None]):
     
     def visitGetExpr(self, expr: expr.Get) -> object:
         obj: object = self.evaluate(expr.object)
-        if isinstance(obj, LoxInstance):
-            return obj.get(expr.name)
-        raise LoxRuntimeError(expr.name, "Only instances have properties.")
+        if not isinstance(obj, LoxInstance):
+            raise LoxRuntimeError(expr.name, "Only instances have properties.")
+
+        # Monomorphic inline cache: most Get sites see the same class every time,
+        # so remember which method the name resolved to and skip the walk up the
+        # superclass chain. Fields shadow methods, so the cache only applies when
+        # the instance has no field of this name. Class identity validates the
+        # cache; method dicts never change after a class is created.
+        name: str = expr.name.lexeme
+        cache: tuple[LoxClass, LoxFunction] | None = getattr(expr, "_methodCache", None)
+        if cache is not None and cache[0] is obj.lox_class and name not in obj.fields:
+            # Reuse the instance's memoized binding so repeated access in a
+            # loop does not allocate a fresh Environment + LoxFunction each time
+            bound: LoxFunction | None = obj._bound_cache.get(name)
+            if bound is None:
+                bound = cache[1].bind(obj)
+                obj._bound_cache[name] = bound
+            return bound
+
+        if name in obj.fields:
+            return obj.fields[name]
+
+        method: LoxFunction | None = obj.lox_class.find_method(name)
+        if method is not None:
+            # The AST nodes are frozen dataclasses, so the cache is stashed past the guard
+            object.__setattr__(expr, "_methodCache", (obj.lox_class, method))
+            bound = obj._bound_cache.get(name)
+            if bound is None:
+                bound = method.bind(obj)
+                obj._bound_cache[name] = bound
+            return bound
+
+        raise LoxRuntimeError(expr.name, f"Undefined property '{name}'.")
     
     def visitSetExpr(self, expr: expr.Set) -> object:
         obj: object = self.evaluate(expr.object)
@@ -165,11 +298,12 @@ class Interpreter(expr.Visitor[object], stmt.Visitor[None]):
     
     def visitSuperExpr(self, expr: expr.Super) -> object:
 
-        distance: int = self.locals[expr]
+        distance: int = expr.resolved[0]  # type: ignore
         # Ignore type errors here, we ensure that "super" and "this" are always the correct type
-        # when interpreting and resolving the class. 
-        superclass: LoxClass = self.env.getAt("super", distance) # type: ignore
-        obj: LoxInstance = self.env.getAt("this", distance-1) # type: ignore
+        # when interpreting and resolving the class. Both live in single-binding
+        # scopes, so they always occupy slot 0.
+        superclass: LoxClass = self.env.getAt(distance, 0) # type: ignore
+        obj: LoxInstance = self.env.getAt(distance-1, 0) # type: ignore
 
         # Just for completeness, run some asserts here
         assert isinstance(superclass, LoxClass) and isinstance(obj, LoxInstance)
@@ -188,10 +322,32 @@ class Interpreter(expr.Visitor[object], stmt.Visitor[None]):
         return self.lookupVariable(expr.name, expr)
     
     def visitAssignExpr(self, expr: Assign) -> object:
+        # Fused counter update (`x = x + c`), annotated by the Resolver: one
+        # slot read, one add, one slot write, no sub-expression dispatch. Only
+        # applies while the variable actually holds a number; anything else
+        # falls through to the generic path (and its error behaviour).
+        delta: float | None = getattr(expr, "fused_delta", None)
+        if delta is not None:
+            resolved: tuple[int, int] | None = getattr(expr, "resolved", None)
+            if resolved is not None:
+                scope: Environment = self.env.chain[resolved[0]]
+                old: object = scope.slots[resolved[1]]
+                if type(old) is float:
+                    new: float = old + delta
+                    scope.slots[resolved[1]] = new
+                    return new
+            else:
+                values: dict[str, object] = self.globals.values
+                old = values.get(expr.name.lexeme)
+                if type(old) is float:
+                    new = old + delta
+                    values[expr.name.lexeme] = new
+                    return new
+
         value: object = self.evaluate(expr.value)
-        distance: int | None = self.locals.get(expr)
-        if distance is not None:
-            self.env.assignAt(distance, expr.name, value)
+        resolved: tuple[int, int] | None = getattr(expr, "resolved", None)
+        if resolved is not None:
+            self.env.assignAt(resolved[0], resolved[1], value)
         else:
             self.globals.assign(expr.name, value)
         return value
@@ -204,12 +360,12 @@ class Interpreter(expr.Visitor[object], stmt.Visitor[None]):
         """Function definition, the function gets passed the current environment as a closure at the moment it is declared. 
         And gets defined in the current environment scope."""
         function: LoxFunction = LoxFunction(stmt, self.env)
-        self.env.define(stmt.name.lexeme, function)
+        self.defineVariable(stmt, function)
         return
     
     def visitIfStmt(self, stmt: If) -> None:
         """Evaluate if statement according to the truthy rules of Lox"""
-        if self.isTruthy(self.evaluate(stmt.condition)):
+        if isTruthy(self.evaluate(stmt.condition)):
             self.execute(stmt.thenBranch)
         elif stmt.elseBranch is not None:
             self.execute(stmt.elseBranch)
@@ -224,7 +380,11 @@ class Interpreter(expr.Visitor[object], stmt.Visitor[None]):
         value: object = None
         if stmt.value is not None:
             value = self.evaluate(stmt.value)
-        raise control_flow.Return(value)
+        # Return is propagated as a flag the statement loops check, instead of
+        # raising an exception; raising/catching costs far more than the one
+        # boolean test per executed statement this adds.
+        self._return_value = value
+        self._returning = True
     
     def visitVarStmt(self, stmt: Var) -> None:
         """
@@ -233,12 +393,12 @@ class Interpreter(expr.Visitor[object], stmt.Visitor[None]):
         value: object = None
         if (stmt.initializer is not None):
             value = self.evaluate(stmt.initializer)
-        
-        self.env.define(stmt.name.lexeme, value)
+
+        self.defineVariable(stmt, value)
         return
     
     def visitBlockStmt(self, stmt: Block) -> None:
-        self.executeBlock(stmt.statements, Environment(self.env))
+        self.executeBlock(stmt.statements, Environment(self.env, getattr(stmt, "num_locals", 0)))
         return
     
     def visitClassStmt(self, stmt: stmt.Class) -> None:
@@ -249,11 +409,15 @@ class Interpreter(expr.Visitor[object], stmt.Visitor[None]):
             if not isinstance(superclass, LoxClass):
                 raise LoxRuntimeError(stmt.superclass.name, "Superclass must be a class.")
 
-        self.env.define(stmt.name.lexeme, None)
+        # Remember where the class name lives so it can be patched up with the
+        # finished class below, independent of the 'super' environment wrapping.
+        definingEnv: Environment = self.env
+        self.defineVariable(stmt, None)
 
         if stmt.superclass is not None:
             self.env = Environment(self.env)
-            self.env.define("super", superclass)
+            # 'super' is the only binding in its scope, so it takes slot 0
+            self.env.defineSlot(superclass)
 
         methods: dict[str, LoxFunction] = {}
         for method in stmt.methods:
@@ -267,35 +431,91 @@ class Interpreter(expr.Visitor[object], stmt.Visitor[None]):
             # self.env.enclosing is *never* None
             self.env = self.env.enclosing  # type: ignore
 
-        self.env.assign(stmt.name, newClass)
+        if definingEnv is Interpreter.globals:
+            definingEnv.assign(stmt.name, newClass)
+        else:
+            definingEnv.slots[stmt.slot] = newClass  # type: ignore
         return
     
     def visitWhileStmt(self, stmt: While) -> None:
-        while self.isTruthy(self.evaluate(stmt.condition)):
-            self.execute(stmt.body)
+        # Arithmetic-only loops are lowered once to a compiled function and run
+        # without re-walking the tree per iteration; the lowering is validated
+        # per execution (all participating variables must hold floats) and
+        # anything else falls through to the plain walker loop below.
+        compiled = getattr(stmt, "_loop_fn", None)
+        if compiled is None:
+            compiled = loop_jit.tryCompile(stmt)
+            object.__setattr__(stmt, "_loop_fn", compiled if compiled is not None else False)
+        if compiled is not None and compiled is not False:
+            if self.runCompiledLoop(compiled):
+                return
+
+        # Locals for everything re-read per iteration (LOAD_FAST vs LOAD_ATTR)
+        evaluate = self.evaluate
+        execute = self.execute
+        condition: Expr = stmt.condition
+        body: Stmt = stmt.body
+        while isTruthy(evaluate(condition)):
+            execute(body)
+            if self._returning:
+                break
         return
     
     ######################## Helper methods
 
+    def runCompiledLoop(self, compiled) -> bool:
+        """Run a lowered while loop: read the participating variables, call the
+        compiled function, write the results back. Returns False (without
+        executing anything) when a variable is unbound or not a float."""
+        function, keys = compiled
+        env: Environment = self.env
+        values: list[float] = []
+        for key in keys:
+            if key[0] == "g":
+                if key[1] not in self.globals.values:
+                    return False
+                value = self.globals.values[key[1]]
+            else:
+                value = env.getAt(key[0], key[1])
+            if type(value) is not float:
+                return False
+            values.append(value)
+
+        results = function(*values)
+
+        for key, value in zip(keys, results):
+            if key[0] == "g":
+                self.globals.values[key[1]] = value
+            else:
+                env.assignAt(key[0], key[1], value)
+        return True
+
+    def defineVariable(self, stmt: Var | Function | stmt.Class, value: object):
+        """Globals stay name-keyed; everywhere else the declaration writes into the slot the Resolver assigned to it."""
+        if self.env is Interpreter.globals:
+            self.env.define(stmt.name.lexeme, value)
+        else:
+            self.env.slots[stmt.slot] = value  # type: ignore
+
     def lookupVariable(self, name: Token, expr: Expr) -> object:
         """
         After a Resolver pass we know where the resolved variable should be, so we can traverse
         the stack of scopes and find the correct resolution. If it is not found (no distance value is known),
         try to find it in the global scope.
         """
-        distance: int | None = self.locals.get(expr)
-        if distance is not None:
-            return self.env.getAt(name.lexeme, distance)
+        resolved: tuple[int, int] | None = getattr(expr, "resolved", None)
+        if resolved is not None:
+            return self.env.getAt(resolved[0], resolved[1])
         else:
             return self.globals.get(name)
 
     def evaluate(self, expr: Expr) -> object:
         """Used in recursive step where the expression is looped back through the tree"""
-        return expr.accept(self)
-    
+        return self._expr_dispatch[type(expr)](expr)
+
     def execute(self, stmt: Stmt):
-        """Use visitor pattern to execute statement"""
-        stmt.accept(self)
+        """Dispatch the statement straight to its handler"""
+        self._stmt_dispatch[type(stmt)](stmt)
 
     def executeBlock(self, statements: list[Stmt], environment: Environment):
         """Execute all statements in a block, using a new environment"""
@@ -303,32 +523,17 @@ class Interpreter(expr.Visitor[object], stmt.Visitor[None]):
         try:
             self.env = environment
 
+            execute = self.execute
             for statement in statements:
-                self.execute(statement)
+                execute(statement)
+                if self._returning:
+                    break
         finally:
             self.env = previous
 
-    def isTruthy(self, value: object) -> bool:
-        """
-        Check if the value is truthy. This is defined as: 
-        falsey => {False, nil}
-        truthy => {everything else}
-        (this is the same as in Ruby)
-        """
-        if value == None:
-            return False
-        if isinstance(value, bool): 
-            return bool(value)
-        return True
-    
-    def isEqual(self, a: object, b: object):
-        """Test equality between two object values"""
-        if a == None and b == None:
-            return True
-        if a == None:
-            return False
-        return a == b
-    
+    # isTruthy/isEqual live at module level (below); they are called per
+    # iteration of every if/while/and/or, so they skip bound-method binding
+
     def stringify(self, value: object) -> str:
         """Helper method for converting object values to strings"""
         if value is None:
@@ -340,11 +545,13 @@ class Interpreter(expr.Visitor[object], stmt.Visitor[None]):
     ########################## Error generation
 
     def checkNumberOperand(self, operator: Token, operand: object):
-        if isinstance(operand, float): 
+        # Exact type identity: Lox numbers are always float instances proper,
+        # so the subclass walk isinstance does is never needed
+        if type(operand) is float:
             return True
         raise LoxRuntimeError(operator, "Operand must be a number")
-    
+
     def checkNumberOperands(self, operator: Token, left: object, right: object):
-        if isinstance(left, float) and isinstance(right, float): 
+        if type(left) is float is type(right):
             return True
         raise LoxRuntimeError(operator, "Operands must be a number")
\ No newline at end of file
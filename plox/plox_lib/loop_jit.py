@@ -0,0 +1,146 @@
+from .asts import expr, stmt
+from .token_type import TokenType
+
+# Numba is strictly optional: when it is importable the lowered loop function is
+# additionally compiled to native code, otherwise the plain Python function is
+# still a large win over re-walking the AST per iteration.
+try:
+    from numba import njit  # type: ignore
+except ImportError:
+    njit = None
+
+# Operators a lowered loop may contain; everything maps 1:1 onto Python floats
+_OP_SRC: dict[TokenType, str] = {
+    TokenType.PLUS: "+",
+    TokenType.MINUS: "-",
+    TokenType.STAR: "*",
+    TokenType.SLASH: "/",
+    TokenType.GREATER: ">",
+    TokenType.GREATER_EQUAL: ">=",
+    TokenType.LESS: "<",
+    TokenType.LESS_EQUAL: "<=",
+    TokenType.EQUAL_EQUAL: "==",
+    TokenType.BANG_EQUAL: "!=",
+}
+
+_COMPARISONS = (TokenType.GREATER, TokenType.GREATER_EQUAL, TokenType.LESS,
+                TokenType.LESS_EQUAL, TokenType.EQUAL_EQUAL, TokenType.BANG_EQUAL)
+
+
+class _Ineligible(Exception):
+    """Raised during analysis when the loop contains anything beyond float
+    arithmetic and assignments; the caller falls back to the tree walker."""
+
+
+class LoopCompiler:
+    """
+    Lowers an arithmetic-only While statement into a single compiled Python
+    function so the hot loop runs as host bytecode (or native code, with Numba)
+    instead of being re-walked node by node every iteration.
+
+    Only loops made of float literals, resolved variables, assignments and the
+    operators above are eligible; anything else (calls, print, declarations,
+    property access) makes the analysis bail out. Variables are identified by
+    the (depth, slot) pairs the Resolver attached, adjusted for blocks inside
+    the loop, so the generated function reads its inputs once, loops, and hands
+    the final values back for a single write-back pass.
+    """
+
+    def __init__(self):
+        # (depth, slot) or ("g", name) => generated parameter name, in first-use order
+        self.vars: dict[tuple, str] = {}
+
+    def compile(self, loop: stmt.While):
+        """Return (function, variable keys) for an eligible loop, or None."""
+        try:
+            condition = loop.condition
+            if not (isinstance(condition, expr.Binary)
+                    and condition.operator.token_type in _COMPARISONS):
+                # Python and Lox disagree on the truthiness of 0.0, so only
+                # conditions that provably produce a boolean are lowered
+                raise _Ineligible()
+            conditionSrc: str = self.exprSrc(condition, 0)
+
+            bodyLines: list[str] = []
+            self.stmtSrc(loop.body, 0, bodyLines)
+            if not bodyLines:
+                raise _Ineligible()
+        except _Ineligible:
+            return None
+
+        names: str = ", ".join(self.vars.values())
+        source: str = "\n".join([
+            f"def _loop({names}):",
+            f"    while {conditionSrc}:",
+            *(f"        {line}" for line in bodyLines),
+            f"    return ({names},)",
+        ])
+        namespace: dict = {}
+        exec(source, namespace)  # noqa: S102 - source is generated above, no user strings
+        function = namespace["_loop"]
+        if njit is not None:
+            try:
+                function = njit(function)
+            except Exception:
+                pass
+        return function, list(self.vars.keys())
+
+    def varName(self, node: expr.Variable | expr.Assign, depth_offset: int) -> str:
+        resolved: tuple[int, int] | None = getattr(node, "resolved", None)
+        if resolved is not None:
+            depth, slot = resolved
+            if depth < depth_offset:
+                # Declared inside the loop itself; not lowered
+                raise _Ineligible()
+            # Key depths relative to the environment the While executes in
+            key: tuple = (depth - depth_offset, slot)
+        else:
+            key = ("g", node.name.lexeme)
+        name = self.vars.get(key)
+        if name is None:
+            name = f"v{len(self.vars)}"
+            self.vars[key] = name
+        return name
+
+    def exprSrc(self, node: expr.Expr, depth_offset: int) -> str:
+        if isinstance(node, expr.Literal):
+            if type(node.value) is float:
+                return repr(node.value)
+            raise _Ineligible()
+        if isinstance(node, expr.Variable):
+            return self.varName(node, depth_offset)
+        if isinstance(node, expr.Grouping):
+            return f"({self.exprSrc(node.expression, depth_offset)})"
+        if isinstance(node, expr.Unary):
+            if node.operator.token_type == TokenType.MINUS:
+                return f"(-{self.exprSrc(node.right, depth_offset)})"
+            raise _Ineligible()
+        if isinstance(node, expr.Binary):
+            op: str | None = _OP_SRC.get(node.operator.token_type)
+            if op is None:
+                raise _Ineligible()
+            left: str = self.exprSrc(node.left, depth_offset)
+            right: str = self.exprSrc(node.right, depth_offset)
+            return f"({left} {op} {right})"
+        raise _Ineligible()
+
+    def stmtSrc(self, node: stmt.Stmt, depth_offset: int, lines: list[str]):
+        if isinstance(node, stmt.Expression) and isinstance(node.expression, expr.Assign):
+            assignment: expr.Assign = node.expression
+            valueSrc: str = self.exprSrc(assignment.value, depth_offset)
+            lines.append(f"{self.varName(assignment, depth_offset)} = {valueSrc}")
+            return
+        if isinstance(node, stmt.Block):
+            if getattr(node, "num_locals", 0):
+                raise _Ineligible()
+            # A block without declarations adds one environment at run time,
+            # so resolved depths inside it are one deeper
+            for statement in node.statements:
+                self.stmtSrc(statement, depth_offset + 1, lines)
+            return
+        raise _Ineligible()
+
+
+def tryCompile(loop: stmt.While):
+    """Analyse and lower a While; returns (function, keys) or None."""
+    return LoopCompiler().compile(loop)
@@ -4,21 +4,29 @@ from .token import Token
 from .token_type import TokenType
 from .asts.stmt import Stmt
 
-from .error import LoxRuntimeError
+from .error import LoxRuntimeError, LoxCompileError
 
 from .scanner import Scanner
 from .parser import Parser
 from .interpreter import Interpreter
 from .resolver import Resolver
+from .compiler import Compiler
+from .vm import VM
 
 class Lox:
 
     hadError = False
     hadRuntimeError = False
 
-    def __init__(self):
-        self.hadError = False
+    def __init__(self, use_vm: bool = False):
+        # report() records errors on the class, so reset (and later read) the
+        # flag there; an instance attribute would shadow it and never trip
+        Lox.hadError = False
         self.interpreter = Interpreter()
+        # Opt-in bytecode backend. Falls back to the tree-walking interpreter
+        # for programs using constructs the compiler does not support yet.
+        self.use_vm = use_vm
+        self.vm = VM()
 
     def runPrompt(self):
         print("Running Prompt")
@@ -35,14 +43,16 @@ class Lox:
             except KeyboardInterrupt:
                 print("\n\tInteractive session interrupted...", end="")
                 break
-            # Reset error flag
-            self.hadError = False
+            # Reset error flag (on the class, where report() sets it)
+            Lox.hadError = False
 
     def runFile(self, file: PathLike):
         print(f"Running file {file}")
 
+        # One read of the whole file; readlines() would allocate a string per
+        # line plus a list only to join them back together
         with open(file, 'r') as source:
-            self.run("".join(source.readlines()))
+            self.run(source.read())
         if self.hadError:
             exit(65)
         if self.hadRuntimeError:
@@ -56,16 +66,32 @@ class Lox:
         statements: list[Stmt] = parser.parse()
 
         # Stop if there was a parsing error
-        if self.hadError: 
+        if Lox.hadError:
             return
-        
+
+        # Static analysis runs regardless of backend: the Resolver carries the
+        # compile-time error checks (top-level return, self-initialising
+        # declarations, ...), which the VM path must not bypass. The slot
+        # annotations it writes are only read by the tree-walker.
         resolver: Resolver = Resolver(self.interpreter)
         resolver.resolveStatements(statements)
 
         # stop if there was a resolution error
-        if self.hadError:
+        if Lox.hadError:
             return
 
+        if self.use_vm:
+            try:
+                chunk = Compiler().compile(statements)
+                try:
+                    return self.vm.run(chunk)
+                except LoxRuntimeError as err:
+                    Lox.runtimeError(err)
+                    return
+            except LoxCompileError:
+                # Program uses constructs the VM does not handle yet
+                pass
+
         return self.interpreter.interpret(statements)
 
     @staticmethod
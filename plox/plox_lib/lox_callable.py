@@ -7,7 +7,10 @@ if TYPE_CHECKING:
     from .interpreter import Interpreter
 
 class LoxCallable(ABC):
-    
+
+    # Empty slots so subclasses can opt out of a per-instance __dict__
+    __slots__ = ()
+
     @abstractmethod
     def call(self, interpreter: "Interpreter", arguments: list[object]) -> object:
         ...
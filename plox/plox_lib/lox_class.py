@@ -1,18 +1,37 @@
+from typing import TYPE_CHECKING
+
 from .lox_callable import LoxCallable
 
 from . import lox_instance
-from . import interpreter
-from . import lox_function
+
+# Only needed for annotations; importing them at runtime executes the circular
+# import workarounds for nothing
+if TYPE_CHECKING:
+    from . import interpreter
+    from . import lox_function
 
 class LoxClass(LoxCallable):
     """
     Container for a Lox Class. Holds methods.
     """
 
+    __slots__ = ("name", "superclass", "methods", "all_methods", "_init_arity")
+
     def __init__(self, name: str, superclass: "LoxClass | None", methods: "dict[str, lox_function.LoxFunction]"):
         self.name: str = name
         self.superclass: LoxClass | None = superclass
         self.methods: "dict[str, lox_function.LoxFunction]" = methods
+        # Flattened method table including inherited methods, so lookups are a
+        # single dict probe instead of a walk up the superclass chain. Lox has
+        # no way to mutate a class after declaration, so this never goes stale.
+        if superclass is not None:
+            self.all_methods: "dict[str, lox_function.LoxFunction]" = {**superclass.all_methods, **methods}
+        else:
+            self.all_methods = dict(methods)
+        # The constructor arity never changes either, so resolve it once here
+        # instead of looking up 'init' on every call-site arity check
+        init: "lox_function.LoxFunction | None" = self.all_methods.get("init")
+        self._init_arity: int = init.arity() if init is not None else 0
 
     def __str__(self) -> str:
         return f"<Class {self.name}>"
@@ -32,14 +51,8 @@ class LoxClass(LoxCallable):
         return instance
     
     def arity(self) -> int:
-        if init := self.find_method("init"):
-            return init.arity()
-        return 0
+        return self._init_arity
+
 
-    
     def find_method(self, name: str) -> "lox_function.LoxFunction | None":
-        if name in self.methods:
-            return self.methods[name]
-        if self.superclass is not None:
-            return self.superclass.find_method(name)
-        return
\ No newline at end of file
+        return self.all_methods.get(name)
\ No newline at end of file
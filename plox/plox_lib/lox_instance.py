@@ -1,36 +1,55 @@
+from typing import TYPE_CHECKING
+
 from .token import Token
 from .error import LoxRuntimeError
 
-from . import lox_class
-from . import lox_function
+# Annotation-only imports; all references are in string hints
+if TYPE_CHECKING:
+    from . import lox_class
+    from . import lox_function
 
 class LoxInstance:
     """
     A container for a Lox Class instance. Holds values in 'self.fields'. For methods, refers back to the original LoxClass.
     """
 
+    # Instances are created per Lox 'new'; no __dict__, attribute access is a
+    # fixed-offset fetch (Lox fields live in the fields dict, not on the object)
+    __slots__ = ("lox_class", "fields", "_bound_cache")
+
     def __init__(self, lox_class: "lox_class.LoxClass"):
         self.lox_class: "lox_class.LoxClass" = lox_class
-        self.fields: dict[str, object] = {} 
+        self.fields: dict[str, object] = {}
+        # Bound methods, memoized per instance: bind() allocates an Environment
+        # and a LoxFunction, and methods are immutable in Lox, so the first
+        # binding stays valid for the lifetime of the instance. ('super'
+        # lookups bypass this cache since they resolve to different methods.)
+        self._bound_cache: "dict[str, lox_function.LoxFunction]" = {}
 
     def __str__(self) -> str:
         return f"<{self.lox_class.name} instance>"
-    
+
     def __repr__(self) -> str:
         return self.__str__()
-    
+
     def get(self, name: Token) -> object:
         """
-        This method returns a property; 
+        This method returns a property;
         either the value of a field, or a method on the class, with 'this' bound.
         """
         if name.lexeme in self.fields:
             return self.fields.get(name.lexeme)
-        
+
+        bound: "lox_function.LoxFunction | None" = self._bound_cache.get(name.lexeme)
+        if bound is not None:
+            return bound
+
         method: "lox_function.LoxFunction | None" = self.lox_class.find_method(name.lexeme)
         if method is not None:
-            return method.bind(self)
-        
+            bound = method.bind(self)
+            self._bound_cache[name.lexeme] = bound
+            return bound
+
         raise LoxRuntimeError(name, f"Undefined property '{name.lexeme}'.")
     
     def set(self, name: Token, value: object):
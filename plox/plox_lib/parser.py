@@ -5,8 +5,37 @@ from .asts.expr import *
 from .error import LoxParseError
 from .params import Params
 
+import operator
+
 from . import lox
 
+# The parse error carries no state of its own (the message goes through
+# Lox.error), so one preallocated instance serves every raise; error-heavy
+# input then recovers without allocating an exception per failure
+_PARSE_ERROR = LoxParseError()
+
+# Hot token types bound to module globals: one LOAD_GLOBAL instead of an enum
+# attribute lookup on every isAtEnd/block/synchronise probe
+_TT_EOF = TokenType.EOF
+_TT_SEMICOLON = TokenType.SEMICOLON
+_TT_RBRACE = TokenType.RIGHT_BRACE
+_TT_EQUAL = TokenType.EQUAL
+_TT_OR = TokenType.OR
+_TT_AND = TokenType.AND
+_TT_BANG = TokenType.BANG
+_TT_MINUS = TokenType.MINUS
+_TT_LPAREN = TokenType.LEFT_PAREN
+_TT_DOT = TokenType.DOT
+_TT_COMMA = TokenType.COMMA
+
+# Keywords that mark a safe place to resume parsing after an error;
+# synchronise() searches for each of them with bytes.find over the token-type
+# buffer, so the values double as the byte patterns to scan for
+_SYNC_TYPES: tuple[TokenType, ...] = (
+    TokenType.CLASS, TokenType.FUN, TokenType.VAR, TokenType.RETURN,
+    TokenType.FOR, TokenType.IF, TokenType.WHILE, TokenType.PRINT,
+)
+
 class Parser:
     """
     Parser class for the Lox language. The following grammar is encoded:
@@ -39,31 +68,55 @@ class Parser:
     primary     => NUMBER | STRING | "true" | "false" | "nil" | "(" expression ")" | IDENTIFIER | "super" "." IDENTIFIER
     """
 
+    # self.current is read on nearly every bytecode-level step of the parse;
+    # slots make it a fixed-offset load instead of a __dict__ probe
+    __slots__ = ("tokens", "token_types", "current", "_literals", "_memo_primary")
+
     def __init__(self, tokens: list[Token]):
         self.tokens: list[Token] = tokens
+        # Parallel array of just the token types: type checks then load an int
+        # from a flat list instead of chasing the Token object and reading an
+        # attribute. The Token itself is only fetched when a rule needs it.
+        self.token_types: list[TokenType] = [token.token_type for token in tokens]
         self.current = 0
+        # Memoized Literal nodes: every occurrence of the same constant shares
+        # one node (and one value object). Keyed on (type, value) so that e.g.
+        # true and 1 stay distinct.
+        self._literals: dict[tuple[type, object], Literal] = {}
+        # Packrat memo for primary(), keyed on token position: (node, position
+        # after the rule). The current grammar is deterministic so this only
+        # pays off when a position is re-parsed (speculative lookahead or
+        # error-recovery paths); it is kept to primary alone so the bookkeeping
+        # stays bounded by the token count.
+        self._memo_primary: dict[int, tuple[Expr, int]] = {}
 
     def parse(self) -> list[Stmt]:
         """program     => declaration* EOF"""
         statements: list[Stmt] = []
-        while not self.isAtEnd():
+        # Hoisted bound methods: drop the attribute lookups per declaration
+        append = statements.append
+        declaration = self.declaration
+        types: list[TokenType] = self.token_types
+        # The try sits outside the inner loop, so error-free source (the
+        # common case) sets up one exception frame total; a parse error drops
+        # back to the outer loop, resynchronises and re-enters
+        while types[self.current] != _TT_EOF:
             try:
-                statements.append(self.declaration())
-            except LoxParseError as e:
+                while types[self.current] != _TT_EOF:
+                    append(declaration())
+            except LoxParseError:
                 self.synchronise()
-        
+
         return statements
 
     ########### Grammar rules encoding
     
     def declaration(self) -> Stmt:
         """declaration => classDecl | funDecl | varDecl | statement"""
-        if self.match(TokenType.CLASS):
-            return self.classDeclaration()
-        if self.match(TokenType.FUN):
-            return self.function("function")
-        if self.match(TokenType.VAR):
-            return self.varDeclaration()
+        handler = Parser._DECL_DISPATCH.get(self.token_types[self.current])
+        if handler is not None:
+            self.current += 1
+            return handler(self)
         return self.statement()
     
     def classDeclaration(self) -> Stmt:
@@ -71,12 +124,14 @@ class Parser:
         name: Token = self.consume(TokenType.IDENTIFIER, "Expect class name.")
 
         superclass: Variable | None = None
-        if self.match(TokenType.LESS):
+        if self.match1(TokenType.LESS):
             superclass = Variable(self.consume(TokenType.IDENTIFIER, "Expect"))
 
         self.consume(TokenType.LEFT_BRACE, "Expect '{' before class body")
         methods: list[Function] = []
-        while not self.check(TokenType.RIGHT_BRACE) and not self.isAtEnd():
+        # Single type read per iteration serves both loop tests, as in block()
+        types: list[TokenType] = self.token_types
+        while types[self.current] != _TT_RBRACE and types[self.current] != _TT_EOF:
             methods.append(self.function("method"))
         self.consume(TokenType.RIGHT_BRACE, "Expect '}' after class body.")
 
@@ -89,11 +144,14 @@ class Parser:
         parameters: list[Token] = []
 
         if not self.check(TokenType.RIGHT_PAREN):
+            # Hoisted limit: one class attribute lookup for the whole list, and
+            # >= so the 256th parameter is the one reported, not the 257th
+            max_count: int = Params.MAX_ARGUMENT_COUNT
             while True:
-                if len(parameters) > Params.MAX_ARGUMENT_COUNT:
-                    self.error(self.peek(), f"Can't have more than {Params.MAX_ARGUMENT_COUNT} parameters.")
+                if len(parameters) >= max_count:
+                    self.error(self.peek(), f"Can't have more than {max_count} parameters.")
                 parameters.append(self.consume(TokenType.IDENTIFIER, "Expect parameter name."))
-                if not self.match(TokenType.COMMA):
+                if not self.match1(_TT_COMMA):
                     break
         self.consume(TokenType.RIGHT_PAREN, "Expect ')' after parameters.")
         self.consume(TokenType.LEFT_BRACE, f"Expect '{{' before {kind} body.")
@@ -104,26 +162,23 @@ class Parser:
         """varDecl     => "var" IDENTIFIER ( "=" expression )? ";\""""
         name: Token = self.consume(TokenType.IDENTIFIER, "Expect variable name")
         initializer: Expr | None = None
-        if (self.match(TokenType.EQUAL)):
+        if (self.match1(_TT_EQUAL)):
             initializer = self.expression()
         self.consume(TokenType.SEMICOLON, "Expect ';' after variable declaration")
         return Var(name, initializer)
 
     def statement(self) -> Stmt:
         """statement   => exprStmt | forStmt | ifStmt | printStmt | whileStmt | block"""
-        if self.match(TokenType.IF):
-            return self.ifStatement()
-        if self.match(TokenType.PRINT):
-            return self.printStatement()
-        if self.match(TokenType.LEFT_BRACE):
-            return Block(self.block())
-        if self.match(TokenType.RETURN):
-            return self.returnStatement()
-        if self.match(TokenType.WHILE):
-            return self.whileStatement()
-        if self.match(TokenType.FOR):
-            return self.forStatement()
+        # Predictive dispatch on the leading token: one dict probe instead of
+        # up to six sequential match calls (tables live at the end of the class)
+        handler = Parser._STMT_DISPATCH.get(self.token_types[self.current])
+        if handler is not None:
+            self.current += 1
+            return handler(self)
         return self.expressionStatement()
+
+    def blockStatement(self) -> Stmt:
+        return Block(self.block())
     
     def forStatement(self) -> Stmt:
         """
@@ -133,9 +188,9 @@ class Parser:
         self.consume(TokenType.LEFT_PAREN, "Expect '(' after 'for'.")
 
         initializer: Stmt | None = None
-        if (self.match(TokenType.SEMICOLON)):
+        if (self.match1(TokenType.SEMICOLON)):
             initializer = None
-        elif self.match(TokenType.VAR):
+        elif self.match1(TokenType.VAR):
             initializer = self.varDeclaration()
         else:
             initializer = self.expressionStatement()
@@ -161,7 +216,7 @@ class Parser:
             body = Block([body, Expression(increment)])
 
         if condition is None:
-            condition = Literal(True)
+            condition = self.makeLiteral(True)
         
         body = While(condition, body)
 
@@ -191,7 +246,7 @@ class Parser:
         self.consume(TokenType.RIGHT_PAREN, "Expect ')' after if condition")
         thenBranch: Stmt = self.statement()
         
-        return If(condition, thenBranch, self.statement() if self.match(TokenType.ELSE) else None)
+        return If(condition, thenBranch, self.statement() if self.match1(TokenType.ELSE) else None)
     
     def whileStatement(self) -> Stmt:
         """whileStmt   => "while" "(" expression ")" statement"""
@@ -212,8 +267,12 @@ class Parser:
         """block       => "{" declaration* "}\""""
         statements: list[Stmt] = []
 
-        while not self.check(TokenType.RIGHT_BRACE) and not self.isAtEnd():
-            statements.append(self.declaration())
+        # One type read per iteration covers both loop tests: the EOF sentinel
+        # is never RIGHT_BRACE, so a separate isAtEnd probe is redundant
+        append = statements.append
+        types: list[TokenType] = self.token_types
+        while types[self.current] != _TT_RBRACE and types[self.current] != _TT_EOF:
+            append(self.declaration())
 
         self.consume(TokenType.RIGHT_BRACE, "Expect '}' after block.")
 
@@ -222,6 +281,90 @@ class Parser:
     def expression(self) -> Expr:
         """expression  => assignment"""
         return self.assignment()
+
+    def isNumericOperand(self, expr: Expr) -> bool:
+        """Can this expression be proven, at parse time, to evaluate to a float?"""
+        if isinstance(expr, Literal):
+            return isinstance(expr.value, float) and not isinstance(expr.value, bool)
+        if isinstance(expr, Grouping):
+            return self.isNumericOperand(expr.expression)
+        if isinstance(expr, Unary):
+            return expr.operator.token_type == TokenType.MINUS and self.isNumericOperand(expr.right)
+        if isinstance(expr, Binary):
+            # Comparisons produce booleans; only arithmetic results stay numeric
+            return getattr(expr, "numeric_fast", False) and expr.operator.token_type in (
+                TokenType.PLUS, TokenType.MINUS, TokenType.STAR, TokenType.SLASH)
+        return False
+
+    def makeLiteral(self, value: object) -> Literal:
+        key: tuple[type, object] = (type(value), value)
+        literal: Literal | None = self._literals.get(key)
+        if literal is None:
+            literal = Literal(value)
+            if isinstance(value, float):
+                # Precompute the printed form once; literals are immutable so it never
+                # goes stale. The node is frozen, hence the object.__setattr__.
+                object.__setattr__(literal, "str_cached", f"{value:g}")
+            self._literals[key] = literal
+        return literal
+
+    # Operators foldable at parse time when both operands are number literals
+    FOLDABLE_OPS = {
+        TokenType.PLUS: lambda l, r: l + r,
+        TokenType.MINUS: lambda l, r: l - r,
+        TokenType.STAR: lambda l, r: l * r,
+        TokenType.SLASH: lambda l, r: l / r,
+        TokenType.GREATER: lambda l, r: l > r,
+        TokenType.GREATER_EQUAL: lambda l, r: l >= r,
+        TokenType.LESS: lambda l, r: l < r,
+        TokenType.LESS_EQUAL: lambda l, r: l <= r,
+        TokenType.EQUAL_EQUAL: lambda l, r: l == r,
+        TokenType.BANG_EQUAL: lambda l, r: l != r,
+    }
+
+    # Unchecked operator functions for numeric-only nodes; picked once at parse
+    # time so evaluation calls the handler directly instead of probing a table
+    NUMERIC_OPS = {
+        TokenType.PLUS: operator.add,
+        TokenType.MINUS: operator.sub,
+        TokenType.STAR: operator.mul,
+        TokenType.SLASH: operator.truediv,
+        TokenType.GREATER: operator.gt,
+        TokenType.GREATER_EQUAL: operator.ge,
+        TokenType.LESS: operator.lt,
+        TokenType.LESS_EQUAL: operator.le,
+        TokenType.EQUAL_EQUAL: operator.eq,
+        TokenType.BANG_EQUAL: operator.ne,
+    }
+
+    def makeBinary(self, left: Expr, operator: Token, right: Expr) -> Expr:
+        """Construct a Binary node, folding it into a Literal when both operands
+        are literals, and marking it numeric-only when both operands are provably
+        floats so the Interpreter can skip its runtime type checks."""
+        if isinstance(left, Literal) and isinstance(right, Literal):
+            folded: Expr | None = self.foldBinary(left.value, operator, right.value)
+            if folded is not None:
+                return folded
+
+        node: Binary = Binary(left, operator, right)
+        if self.isNumericOperand(left) and self.isNumericOperand(right):
+            object.__setattr__(node, "numeric_fast", True)
+            object.__setattr__(node, "op_fn", Parser.NUMERIC_OPS[operator.token_type])
+        return node
+
+    def foldBinary(self, left: object, operator: Token, right: object) -> Expr | None:
+        """Evaluate a constant binary expression at parse time, or return None when
+        it cannot be folded safely. Division by zero is left to fail at runtime."""
+        token_type: TokenType = operator.token_type
+        if isinstance(left, float) and isinstance(right, float):
+            if token_type == TokenType.SLASH and right == 0:
+                return None
+            if token_type in Parser.FOLDABLE_OPS:
+                return self.makeLiteral(Parser.FOLDABLE_OPS[token_type](left, right))
+        elif isinstance(left, str) and isinstance(right, str):
+            if token_type == TokenType.PLUS:
+                return self.makeLiteral(left + right)
+        return None
     
     def assignment(self) -> Expr:
         """assignment  => ( call "." )? IDENTIFIER "=" assignment | logic_or"""
@@ -232,94 +375,103 @@ class Parser:
         # if the found expression is followed by an "=", it *must* be an assignment
         # So it should fall through to the 'primary' rule, yielding a Variable.
         # Anything else results in an error
-        if self.match(TokenType.EQUAL):
+        if self.match1(_TT_EQUAL):
             # The info of "=" itself
             equals: Token = self.previous()
             # the rhs, which can be an equality itself, otherwise drop down the priority list
             value: Expr = self.assignment()
 
             # If what we found for the lhs is a variable, parse the rhs and assign
-            if isinstance(expr, Variable):
+            # (AST node classes have no subclasses, so an exact type test is a
+            # single pointer compare instead of an isinstance MRO walk)
+            if type(expr) is Variable:
                 name: Token = expr.name
                 return Assign(name, value)
             # If the lhs has the form of a 'Get' expression, transform it into
             # a corresponding 'Set' expression
-            elif isinstance(expr, Get):
+            elif type(expr) is Get:
                 return Set(expr.object, expr.name, value)
             self.error(equals, "Invalid assignment target.")
         
         return expr
     
     def logic_or(self) -> Expr:
+        """logic_or    => logic_and ("or" logic_and)*"""
         expr: Expr = self.logic_and()
 
-        if self.match(TokenType.OR):
+        # A loop, not a single match: 'a or b or c' folds left-associatively
+        # instead of stranding the trailing operator for the caller to trip on
+        while self.match1(_TT_OR):
             operator: Token = self.previous()
             right: Expr = self.logic_and()
-            return Logical(expr, operator, right)
+            expr = Logical(expr, operator, right)
 
         return expr
 
     def logic_and(self)-> Expr:
-        expr: Expr = self.equality()
+        """logic_and   => equality ("and" equality)*"""
+        expr: Expr = self.binaryExpression()
 
-        if self.match(TokenType.AND):
+        while self.match1(_TT_AND):
             operator: Token = self.previous()
-            right: Expr = self.equality()
-            return Logical(expr, operator, right)
+            right: Expr = self.binaryExpression()
+            expr = Logical(expr, operator, right)
 
         return expr
-    
-    def equality(self) -> Expr:
-        """equality    => comparison ( ( "!=" | "==" ) comparison )*"""
-        expr: Expr = self.comparison()
-
-        while self.match(TokenType.BANG_EQUAL, TokenType.EQUAL_EQUAL):
-            operator: Token = self.previous()
-            right: Expr = self.comparison()
-            expr = Binary(expr, operator, right)
 
-        return expr
-    
-    def comparison(self) -> Expr:
-        """comparison  => term ( ( ">" | ">=" | "<" | "<=" ) term )*"""
-        expr: Expr = self.term()
-
-        while self.match(TokenType.GREATER, TokenType.GREATER_EQUAL, TokenType.LESS, TokenType.LESS_EQUAL):
-            operator: Token = self.previous()
-            right: Expr = self.term()
-            expr = Binary(expr, operator, right)
-
-        return expr
-
-    def term(self) -> Expr: 
-        """term        => factor ( ( "-" | "+" ) factor )*"""
-        expr: Expr = self.factor()
-
-        while self.match(TokenType.MINUS, TokenType.PLUS):
-            operator: Token = self.previous()
-            right: Expr = self.term()
-            expr = Binary(expr, operator, right)
-
-        return expr
-
-    def factor(self) -> Expr:
-        """factor      => unary ( ( "/" | "*" ) unary )*"""
+    # Binding power per binary operator, mirroring the equality/comparison/
+    # term/factor rule ordering of the grammar. All Lox binary operators are
+    # left-associative.
+    BINARY_PRECEDENCE = {
+        TokenType.BANG_EQUAL: 1,
+        TokenType.EQUAL_EQUAL: 1,
+        TokenType.GREATER: 2,
+        TokenType.GREATER_EQUAL: 2,
+        TokenType.LESS: 2,
+        TokenType.LESS_EQUAL: 2,
+        TokenType.MINUS: 3,
+        TokenType.PLUS: 3,
+        TokenType.SLASH: 4,
+        TokenType.STAR: 4,
+    }
+
+    def binaryExpression(self, min_precedence: int = 1) -> Expr:
+        """
+        Precedence-climbing (Pratt) loop covering the equality, comparison,
+        term and factor rules in one function: parse a unary operand, then keep
+        folding in operators that bind at least as tightly as min_precedence.
+        One Python frame per operand instead of one per precedence level.
+        """
         expr: Expr = self.unary()
 
-        while self.match(TokenType.STAR, TokenType.SLASH):
-            operator: Token = self.previous()
-            right: Expr = self.term()
-            expr = Binary(expr, operator, right)
+        tokens: list[Token] = self.tokens
+        types: list[TokenType] = self.token_types
+        precedences = _BINARY_PREC
+        while True:
+            precedence = precedences[types[self.current]]
+            if precedence < min_precedence:
+                break
+            operator: Token = tokens[self.current]
+            self.current += 1
+            # Left-associative: the right operand may only contain operators
+            # that bind strictly tighter
+            right: Expr = self.binaryExpression(precedence + 1)
+            expr = self.makeBinary(expr, operator, right)
 
         return expr
 
     def unary(self) -> Expr:
         """unary       => ( "!" | "-" ) unary | primary"""
 
-        if self.match(TokenType.BANG, TokenType.MINUS):
+        if self.match2(_TT_BANG, _TT_MINUS):
             operator: Token = self.previous()
             right: Expr = self.unary()
+            # Fold constant operands: -<number> and !<literal> need no runtime work
+            if isinstance(right, Literal):
+                if operator.token_type == TokenType.MINUS and isinstance(right.value, float):
+                    return self.makeLiteral(-right.value)
+                if operator.token_type == TokenType.BANG:
+                    return self.makeLiteral(right.value is None or right.value is False)
             return Unary(operator, right)
         return self.call()
     
@@ -328,26 +480,31 @@ class Parser:
         """call        => primary ( "(" arguments? ")" | "." IDENTIFIER )*"""
         expr: Expr = self.primary()
 
+        types: list[TokenType] = self.token_types
         while True:
-            if self.match(TokenType.LEFT_PAREN):
+            token_type = types[self.current]
+            if token_type == _TT_LPAREN:
+                self.current += 1
                 expr = self.finishCall(expr)
-            elif self.match(TokenType.DOT):
+            elif token_type == _TT_DOT:
+                self.current += 1
                 name: Token = self.consume(TokenType.IDENTIFIER, "Expect property name after '.'.")
                 expr = Get(expr, name)
             else:
                 break
 
-        return expr        
+        return expr
 
     def finishCall(self, callee: Expr) -> Expr:
         arguments: list[Expr] = []
 
         if not self.check(TokenType.RIGHT_PAREN):
+            max_count: int = Params.MAX_ARGUMENT_COUNT
             while True:
-                if len(arguments) > Params.MAX_ARGUMENT_COUNT:
-                    self.error(self.peek(), f"Can't have more than {Params.MAX_ARGUMENT_COUNT} arguments.")
+                if len(arguments) >= max_count:
+                    self.error(self.peek(), f"Can't have more than {max_count} arguments.")
                 arguments.append(self.expression())
-                if not self.match(TokenType.COMMA):
+                if not self.match1(_TT_COMMA):
                     break
 
         paren: Token = self.consume(TokenType.RIGHT_PAREN, "Expect ')' after arguments")
@@ -356,90 +513,146 @@ class Parser:
 
     def primary(self) -> Expr:
         """primary     => NUMBER | STRING | "true" | "false" | "nil" | "(" expression ")" | IDENTIFIER | "super" "." IDENTIFIER"""
-        if self.match(TokenType.FALSE): return Literal(False)
-        if self.match(TokenType.TRUE): return Literal(True)
-        if self.match(TokenType.NIL): return Literal(None)
-        if self.match(TokenType.NUMBER, TokenType.STRING):
-            return Literal(self.previous().literal)
-        if self.match(TokenType.SUPER):
-            keyword: Token = self.previous()
-            self.consume(TokenType.DOT, "Expect '.' after 'super'.")
-            method: Token = self.consume(TokenType.IDENTIFIER, "Expect superclass method name.")
-            return Super(keyword, method)
-        if self.match(TokenType.THIS):
-            return This(self.previous())
-        if self.match(TokenType.IDENTIFIER):
-            return Variable(self.previous())
-        if self.match(TokenType.LEFT_PAREN):
-            expr: Expr = self.expression()
-            self.consume(TokenType.RIGHT_PAREN, "Expect ')' after expression")
-            return Grouping(expr)
+        start: int = self.current
+        memo = self._memo_primary.get(start)
+        if memo is not None:
+            expr, self.current = memo
+            return expr
+        handler = Parser._PRIMARY_DISPATCH.get(self.token_types[start])
+        if handler is not None:
+            self.current = start + 1
+            expr: Expr = handler(self)
+            self._memo_primary[start] = (expr, self.current)
+            return expr
         raise self.error(self.peek(), "Expect expression")
 
+    def superExpression(self) -> Expr:
+        keyword: Token = self.previous()
+        self.consume(TokenType.DOT, "Expect '.' after 'super'.")
+        method: Token = self.consume(TokenType.IDENTIFIER, "Expect superclass method name.")
+        return Super(keyword, method)
+
+    def groupingExpression(self) -> Expr:
+        expr: Expr = self.expression()
+        self.consume(TokenType.RIGHT_PAREN, "Expect ')' after expression")
+        return Grouping(expr)
+
     
     ############ Helper methods for traversing the tokens
 
-    def match(self, *token_types: TokenType) -> bool:
-        """
-        Similar to check(), but with multiple token types.
-        Also consumes the token if a match is found.
-        """
-        for token_type in token_types:
-            if self.check(token_type):
-                self.advance()
-                return True
+    # Fixed-arity match helpers: no *args tuple per call, one read of the
+    # current token type, and no separate isAtEnd round trip (the EOF sentinel
+    # token never equals a requested type, so matching can never run past it).
+    # Rules that used to probe several alternatives through a variadic match
+    # now go through the dispatch tables or the precedence dict instead.
+
+    def match1(self, a: TokenType) -> bool:
+        if self.token_types[self.current] == a:
+            self.current += 1
+            return True
         return False
-    
+
+    def match2(self, a: TokenType, b: TokenType) -> bool:
+        token_type = self.token_types[self.current]
+        if token_type == a or token_type == b:
+            self.current += 1
+            return True
+        return False
+
     def consume(self, token_type: TokenType, message: str) -> Token:
         """
         Consume the next token and make sure it matches the requested token.
         Otherwise throw an error.
         """
-        if self.check(token_type): return self.advance()
+        # check() and advance() inlined: consume sits behind every mandatory
+        # token, so the two extra method calls were pure dispatch overhead
+        if self.token_types[self.current] == token_type:
+            self.current += 1
+            return self.tokens[self.current - 1]
         raise self.error(self.peek(), message)
     
     def check(self, token_type: TokenType) -> bool:
         """Check if the next token is of the selected type"""
-        if self.isAtEnd():
-            return False
-        return self.peek().token_type == token_type
+        # One int compare; the EOF sentinel is a TokenType of its own and is
+        # never the requested type, so no separate end-of-stream test is needed
+        return self.token_types[self.current] == token_type
     
     def peek(self) -> Token:
         """Get next token"""
         return self.tokens[self.current]
     
-    def advance(self) -> Token:
-        """Advances the token pointer if not at the end of the stream"""
-        if not self.isAtEnd(): self.current +=1
-        return self.previous()
-    
     def previous(self) -> Token:
         """Get previously seen token for looking back"""
         return self.tokens[self.current-1]
-    
-    def isAtEnd(self) -> bool:
-        """Check if the token stream is at the end"""
-        return self.peek().token_type == TokenType.EOF
-    
+
     def error(self, token: Token, message: str) -> LoxParseError:
         lox.Lox.error(token, message)
-        return LoxParseError()
+        return _PARSE_ERROR
     
     def synchronise(self):
         """
         Sync method used to sync up the parser after an error.
         Syncing is assumed after a semicolon (;) or on keywords
         """
-        # advance to token directly after error
-        self.advance()
-        while not self.isAtEnd():
-            # If a semicolon is found, sync directly after
-            if self.previous().token_type == TokenType.SEMICOLON: return
-            # On keywords, sync up
-            match self.peek().token_type:
-                case TokenType.CLASS | TokenType.FUN | TokenType.VAR   | TokenType.RETURN \
-                    | TokenType.FOR  | TokenType.IF  | TokenType.WHILE | TokenType.PRINT:
-                    return
-                
-            # No match, discard token and keep searching
-            self.advance()
+        types: list[TokenType] = self.token_types
+        # advance to token directly after error; this is the one place that can
+        # already be sitting on EOF, so it keeps the end guard advance() dropped
+        if types[self.current] != _TT_EOF:
+            self.current += 1
+        start: int = self.current
+
+        # Token types all fit in a byte, so the skip runs as C-level substring
+        # searches over a bytes copy instead of a Python loop per discarded
+        # token: find the position right after the nearest semicolon, then the
+        # nearest statement keyword before it, and resume at whichever wins.
+        buf: bytes = bytes(types)
+        end: int = len(buf) - 1  # the EOF sentinel
+        semicolon: int = buf.find(_TT_SEMICOLON, start - 1 if start else 0)
+        resume: int = semicolon + 1 if semicolon != -1 else end
+        if resume > start:
+            for sync_type in _SYNC_TYPES:
+                found: int = buf.find(sync_type, start, resume)
+                if found != -1:
+                    resume = found
+        self.current = resume if resume < end else end
+
+    ############ Predictive dispatch tables, keyed on the leading token.
+    # Defined last so the plain method references above them resolve; the FUN
+    # entry needs a lambda to pass the declaration kind through.
+
+    _DECL_DISPATCH = {
+        TokenType.CLASS: classDeclaration,
+        TokenType.FUN: lambda self: self.function("function"),
+        TokenType.VAR: varDeclaration,
+    }
+
+    _STMT_DISPATCH = {
+        TokenType.IF: ifStatement,
+        TokenType.PRINT: printStatement,
+        TokenType.LEFT_BRACE: blockStatement,
+        TokenType.RETURN: returnStatement,
+        TokenType.WHILE: whileStatement,
+        TokenType.FOR: forStatement,
+    }
+
+    _PRIMARY_DISPATCH = {
+        TokenType.FALSE: lambda self: self.makeLiteral(False),
+        TokenType.TRUE: lambda self: self.makeLiteral(True),
+        TokenType.NIL: lambda self: self.makeLiteral(None),
+        TokenType.NUMBER: lambda self: self.makeLiteral(self.previous().literal),
+        TokenType.STRING: lambda self: self.makeLiteral(self.previous().literal),
+        TokenType.SUPER: superExpression,
+        TokenType.THIS: lambda self: This(self.previous()),
+        TokenType.IDENTIFIER: lambda self: Variable(self.previous()),
+        TokenType.LEFT_PAREN: groupingExpression,
+    }
+
+
+# Flat precedence table indexed by TokenType value, zero for non-operators:
+# the Pratt loop then indexes a tuple per token instead of probing a dict
+# (same layout trick as the Interpreter's binary handler table)
+_prec = [0] * (max(TokenType) + 1)
+for _tt, _p in Parser.BINARY_PRECEDENCE.items():
+    _prec[_tt] = _p
+_BINARY_PREC: tuple[int, ...] = tuple(_prec)
+del _prec, _tt, _p
@@ -2,23 +2,14 @@ from .interpreter import Interpreter
 from .asts.stmt import Stmt
 from .asts.expr import Expr
 from .token import Token
+from .token_type import TokenType
 from .utils import FunctionType, ClassType
+from .asts.expr import Binary, Variable, Literal
 
 from .asts import expr, stmt
 
 from . import lox
 
-class Scoped:
-
-    def __init__(self, resolver: "Resolver"):
-        self.resolver = resolver
-
-    def __enter__(self):
-        self.resolver.scopes.append({})
-
-    def __exit__(self, exc_type, exc_value, exc_traceback):
-        self.resolver.scopes.pop()
-
 class Resolver(stmt.Visitor[None], expr.Visitor[None]):
     """ 
     This class is used to resolve variables, functions and classes to it's correct scope.
@@ -30,41 +21,86 @@ class Resolver(stmt.Visitor[None], expr.Visitor[None]):
     and variable resolution.
     """
 
+    __slots__ = ("interpreter", "scopes", "currentFunction", "currentClass", "_scope_pool",
+                 "_expr_dispatch", "_stmt_dispatch")
+
     def __init__(self, interpreter: Interpreter):
         self.interpreter: Interpreter = interpreter
         # Python lists can function fine as stacks using append() and pop()
-        # This structure holds a stack of scopes that are currently available. The str is the name of the 
-        # variable, function or class, the bool is if it is initialised fully.
-        self.scopes: list[dict[str, bool]] = []
+        # This structure holds a stack of scopes that are currently available. The str is the name of the
+        # variable, function or class, the value is a [slot index, initialised fully] pair. Slots are
+        # handed out in declaration order so the Interpreter's Environments can store locals in a flat
+        # list instead of a name-keyed dict.
+        self.scopes: list[dict[str, list]] = []
         self.currentFunction: FunctionType = FunctionType.NONE
         self.currentClass: ClassType = ClassType.NONE
+        # Retired scope dicts, cleared and reused by beginScope: blocks are
+        # plentiful and short-lived, so recycling keeps one warm dict around
+        # instead of allocating a fresh hash table per scope
+        self._scope_pool: list[dict[str, list]] = []
+
+        # Node-type -> bound visit method, same dispatch scheme as the
+        # Interpreter: one dict probe and a direct call per node instead of
+        # the accept() double dispatch
+        self._stmt_dispatch = {
+            stmt.Block: self.visitBlockStmt,
+            stmt.Class: self.visitClassStmt,
+            stmt.Expression: self.visitExpressionStmt,
+            stmt.Function: self.visitFunctionStmt,
+            stmt.If: self.visitIfStmt,
+            stmt.Print: self.visitPrintStmt,
+            stmt.Return: self.visitReturnStmt,
+            stmt.Var: self.visitVarStmt,
+            stmt.While: self.visitWhileStmt,
+        }
+        self._expr_dispatch = {
+            expr.Assign: self.visitAssignExpr,
+            expr.Binary: self.visitBinaryExpr,
+            expr.Call: self.visitCallExpr,
+            expr.Get: self.visitGetExpr,
+            expr.Grouping: self.visitGroupingExpr,
+            expr.Literal: self.visitLiteralExpr,
+            expr.Logical: self.visitLogicalExpr,
+            expr.Set: self.visitSetExpr,
+            expr.Super: self.visitSuperExpr,
+            expr.This: self.visitThisExpr,
+            expr.Unary: self.visitUnaryExpr,
+            expr.Variable: self.visitVariableExpr,
+        }
 
     def noScope(self) -> bool:
         return len(self.scopes) == 0
     
-    def peekScope(self) -> dict[str, bool]:
+    def peekScope(self) -> dict[str, list]:
         return self.scopes[-1]
     
     def numScopes(self) -> int:
         return len(self.scopes)
 
     def resolveStatements(self, statements: list[Stmt]):
+        # Hoisted locals: skip the attribute lookups per sibling statement
+        dispatch = self._stmt_dispatch
         for statement in statements:
-            self.resolveStatement(statement)
+            dispatch[type(statement)](statement)
 
     def resolveStatement(self, statement: Stmt):
-        statement.accept(self)
+        self._stmt_dispatch[type(statement)](statement)
 
     def resolveExpression(self, expression: Expr):
-        expression.accept(self)
+        self._expr_dispatch[type(expression)](expression)
 
     def resolveLocal(self, expr: Expr, name: Token):
         """Resolve a local variable to the nearest definition."""
-        # Go through all scopes from nearest up to global to resolve a variable to the closest possible option
-        for i in range(self.numScopes()):
-            # If found, defer to the interpreter to get the actual resolution content
-            if name.lexeme in self.scopes[self.numScopes() - 1 - i]:
-                self.interpreter.resolve(expr, i)
+        # Walk the scopes from innermost out; reversed() iterates the stack
+        # without recomputing the index arithmetic per level, and one get()
+        # replaces the contains-then-index double probe
+        lexeme: str = name.lexeme
+        for depth, scope in enumerate(reversed(self.scopes)):
+            entry = scope.get(lexeme)
+            if entry is not None:
+                # Store the (depth, slot) pair directly on the node; unresolved
+                # nodes keep no annotation and fall through to the global scope.
+                object.__setattr__(expr, "resolved", (depth, entry[0]))
                 return
             
     def resolveFunction(self, function: stmt.Function, kind: FunctionType):
@@ -73,53 +109,85 @@ class Resolver(stmt.Visitor[None], expr.Visitor[None]):
         enclosingFunction: FunctionType = self.currentFunction
         self.currentFunction = kind
 
-        with Scoped(self):
-            for param in function.params:
-                self.declare(param)
-                self.define(param)
-            self.resolveStatements(function.body)
+        # Scopes are pushed and popped directly; the old Scoped context manager
+        # allocated an object and two protocol calls per scope, and resolver
+        # errors are reported through Lox.error rather than raised, so there is
+        # no exception path that needs the with-statement's cleanup guarantee.
+        self.beginScope()
+        declare = self.declare
+        define = self.define
+        for param in function.params:
+            declare(param)
+            define(param)
+        self.resolveStatements(function.body)
+        # Record the frame size so calls can allocate the locals list in one go.
+        # The node is frozen, so the annotation lives outside the dataclass fields.
+        object.__setattr__(function, "num_locals", len(self.peekScope()))
+        self.endScope()
 
         # Restore function nesting state to before
         self.currentFunction = enclosingFunction
 
     def beginScope(self):
-        self.scopes.append({})
+        pool = self._scope_pool
+        self.scopes.append(pool.pop() if pool else {})
 
     def endScope(self):
-        self.scopes.pop()
+        scope = self.scopes.pop()
+        scope.clear()
+        self._scope_pool.append(scope)
 
     def declare(self, name: Token):
-        """Declare a variable as available but uninitialised"""
+        """Declare a variable as available but uninitialised, claiming the next slot in the scope"""
         if self.noScope():
             return
-        scope: dict[str, bool] = self.peekScope()
+        scope: dict[str, list] = self.peekScope()
         if name.lexeme in scope:
             lox.Lox.error(name, f"Variable with this name already defined in this scope")
-        scope[name.lexeme]  = False
+            # Keep the already-claimed slot: num_locals counts unique names,
+            # so a fresh index here would point past the pre-sized slot list
+            scope[name.lexeme][1] = False
+            return
+        scope[name.lexeme] = [len(scope), False]
+
+    def annotateSlot(self, stmt: Stmt):
+        """Attach the slot index of a local declaration to its node, so the
+        Interpreter can write straight into a pre-sized slot list."""
+        if self.noScope():
+            return
+        object.__setattr__(stmt, "slot", self.peekScope()[stmt.name.lexeme][0])  # type: ignore
 
     def define(self, name: Token):
         """Set a declared variable to initialised"""
         if self.noScope():
             return
-        self.peekScope()[name.lexeme] = True    
+        scope: dict[str, list] = self.peekScope()
+        if name.lexeme in scope:
+            scope[name.lexeme][1] = True
+        else:
+            scope[name.lexeme] = [len(scope), True]
 
     ############################### stmt.Visitor implementation
 
     def visitBlockStmt(self, stmt: stmt.Block) -> None:
-        with Scoped(self):
-            self.resolveStatements(stmt.statements)
+        self.beginScope()
+        self.resolveStatements(stmt.statements)
+        object.__setattr__(stmt, "num_locals", len(self.peekScope()))
+        self.endScope()
         return
-    
+
     def visitVarStmt(self, stmt: stmt.Var) -> None:
         self.declare(stmt.name)
         if stmt.initializer is not None:
             self.resolveExpression(stmt.initializer)
         self.define(stmt.name)
+        self.annotateSlot(stmt)
         return
-    
+
     def visitFunctionStmt(self, stmt: stmt.Function) -> None:
         self.declare(stmt.name)
         self.define(stmt.name)
+        self.annotateSlot(stmt)
 
         self.resolveFunction(stmt, FunctionType.FUNCTION)
         return
@@ -140,10 +208,10 @@ class Resolver(stmt.Visitor[None], expr.Visitor[None]):
         return
     
     def visitReturnStmt(self, stmt: stmt.Return) -> None:
-        if self.currentFunction == FunctionType.NONE:
+        if self.currentFunction is FunctionType.NONE:
             lox.Lox.error(stmt.keyword, "Can't return from top-level code.")
         if stmt.value is not None:
-            if self.currentFunction == FunctionType.INITIALIZER:
+            if self.currentFunction is FunctionType.INITIALIZER:
                 lox.Lox.error(stmt.keyword, "Can't return a value from an initializer.")
             self.resolveExpression(stmt.value)
         return
@@ -159,42 +227,32 @@ class Resolver(stmt.Visitor[None], expr.Visitor[None]):
 
         self.declare(stmt.name)
         self.define(stmt.name)
+        self.annotateSlot(stmt)
 
-        if stmt.superclass is not None:
+        has_superclass: bool = stmt.superclass is not None
+        if has_superclass:
             if stmt.name.lexeme == stmt.superclass.name.lexeme:
                 lox.Lox.error(stmt.superclass.name, "Class can't inherit from itself.")
 
             self.currentClass = ClassType.SUBCLASS
             self.resolveExpression(stmt.superclass)
 
-            with Scoped(self):
-                # Make sure super is bound when there is a superclass
-                self.peekScope()["super"] = True
-                with Scoped(self):
-                    self.peekScope()["this"] = True
-                    for method in stmt.methods:
-                        declaration: FunctionType = FunctionType.INITIALIZER if method.name.lexeme == "init" else FunctionType.METHOD
-                        self.resolveFunction(method, declaration)
-        else:
-            with Scoped(self):
-                self.peekScope()["this"] = True
-                for method in stmt.methods:
-                    declaration: FunctionType = FunctionType.INITIALIZER if method.name.lexeme == "init" else FunctionType.METHOD
-                    self.resolveFunction(method, declaration)
-
-        # self.beginScope()
-        # # Make sure 'this' is bound for each class in the class scope
-        # # similar to a closure
-        # self.peekScope()["this"] = True
+            # Make sure super is bound when there is a superclass
+            self.beginScope()
+            self.peekScope()["super"] = [0, True]
 
-        # for method in stmt.methods:
-        #     declaration: FunctionType = FunctionType.INITIALIZER if method.name.lexeme == "init" else FunctionType.METHOD
-        #     self.resolveFunction(method, declaration)
+        # Make sure 'this' is bound for each class in the class scope,
+        # similar to a closure; the method loop itself is the same whether or
+        # not a superclass scope was pushed around it
+        self.beginScope()
+        self.peekScope()["this"] = [0, True]
+        for method in stmt.methods:
+            declaration: FunctionType = FunctionType.INITIALIZER if method.name.lexeme == "init" else FunctionType.METHOD
+            self.resolveFunction(method, declaration)
+        self.endScope()
 
-        # self.endScope()
-
-        # if stmt.superclass is not None:
-        #     self.endScope()
+        if has_superclass:
+            self.endScope()
 
         self.currentClass = enclosingClass
         return
@@ -204,7 +262,8 @@ class Resolver(stmt.Visitor[None], expr.Visitor[None]):
     def visitVariableExpr(self, expr: expr.Variable) -> None:
         # In the case the variable has been declared, but not yet initialised, this is an error
         # This would be the case where the variable is used in its own initialiser
-        if not self.noScope() and self.peekScope().get(expr.name.lexeme) == False:
+        entry = None if self.noScope() else self.peekScope().get(expr.name.lexeme)
+        if entry is not None and entry[1] == False:
             #print("\t", expr, "\n\t\t", self.noScope(), self.peekScope(), self.scopes)
             lox.Lox.error(expr.name, "Can't read local variable in its own initialiser")
 
@@ -216,6 +275,22 @@ class Resolver(stmt.Visitor[None], expr.Visitor[None]):
         self.resolveExpression(expr.value)
         # Then use the scope map to resolve the variable it's begin assigned to
         self.resolveLocal(expr, expr.name)
+
+        # Fuse the ubiquitous loop-counter shape `x = x + c` / `x = x - c` into
+        # a single annotated super-instruction: the Interpreter then updates the
+        # slot in place instead of evaluating three nodes. Both sides must
+        # resolve to the same binding, so shadowed names never fuse wrongly.
+        value = expr.value
+        if (isinstance(value, Binary)
+                and isinstance(value.left, Variable)
+                and isinstance(value.right, Literal)
+                and type(value.right.value) is float
+                and value.left.name.lexeme == expr.name.lexeme
+                and getattr(value.left, "resolved", None) == getattr(expr, "resolved", None)):
+            if value.operator.token_type == TokenType.PLUS:
+                object.__setattr__(expr, "fused_delta", value.right.value)
+            elif value.operator.token_type == TokenType.MINUS:
+                object.__setattr__(expr, "fused_delta", -value.right.value)
         return
     
     def visitBinaryExpr(self, expr: expr.Binary) -> None:
@@ -224,9 +299,10 @@ class Resolver(stmt.Visitor[None], expr.Visitor[None]):
         return
     
     def visitCallExpr(self, expr: expr.Call) -> None:
-        self.resolveExpression(expr.callee)
+        dispatch = self._expr_dispatch
+        dispatch[type(expr.callee)](expr.callee)
         for argument in expr.arguments:
-            self.resolveExpression(argument)
+            dispatch[type(argument)](argument)
         return
     
     def visitGetExpr(self, expr: expr.Get) -> None:
@@ -239,15 +315,15 @@ class Resolver(stmt.Visitor[None], expr.Visitor[None]):
         return
     
     def visitSuperExpr(self, expr: expr.Super) -> None:
-        if self.currentClass == ClassType.NONE:
+        if self.currentClass is ClassType.NONE:
             lox.Lox.error(expr.keyword, "Can't use 'super' outside of a class.")
-        elif self.currentClass != ClassType.SUBCLASS:
+        elif self.currentClass is not ClassType.SUBCLASS:
             lox.Lox.error(expr.keyword, "Can't use 'super' in a class without a subclass.")
         self.resolveLocal(expr, expr.keyword)
         return
     
     def visitThisExpr(self, expr: expr.This) -> None:
-        if self.currentClass == ClassType.NONE:
+        if self.currentClass is ClassType.NONE:
             lox.Lox.error(expr.keyword, "Can't use 'this' outside of a class.")
             return
         self.resolveLocal(expr, expr.keyword)
@@ -1,17 +1,31 @@
 from .token import Token
 from .token_type import TokenType
-from .utils import Char, is_num, is_alnum, is_alpha, TOKEN_MAP, KEYWORDS
+from .utils import KEYWORDS
 
+from sys import intern
 from typing import Any
+import re
 
 from . import lox
 
+# Bulk-scan patterns: the identifier/number tails are consumed by the regex
+# engine's C loop in one call instead of a Python-level peek/advance per char.
+# _WS_RE skips a whole run of intra-line whitespace the same way, so indented
+# source costs one dispatch per run instead of one per space (newlines are
+# excluded: they are dispatched individually to keep the line count)
+_IDENT_RE = re.compile(r"[A-Za-z0-9_]*")
+_DIGITS_RE = re.compile(r"[0-9]*")
+_WS_RE = re.compile(r"[ \t\r]*")
+
 class Scanner:
 
     def __init__(self, source: str):
 
         # Data initialisation
         self.source = source
+        # Hoisted once: the end-of-input checks run per token, and len() on
+        # every call was a needless C-API round trip
+        self.length = len(source)
         self.tokens: list[Token] = []
 
         # Used in scanner state management
@@ -19,8 +33,17 @@ class Scanner:
         self.current = 0
         self.line = 1
 
+        # Flyweight cache for operator/punctuation tokens: their lexeme is
+        # fully determined by the token type, so within a line every "+", ";"
+        # etc. can share one Token object. Nothing downstream mutates tokens
+        # (the parser only reads them and the AST nodes alias them), so
+        # sharing is safe; keyed on line too because errors report it.
+        self._op_tokens: dict[tuple[TokenType, int], Token] = {}
+
     def scanTokens(self) -> list[Token]:
-        while not self.isAtEnd():
+        # Inlined isAtEnd: this is the outermost per-token loop
+        length = self.length
+        while self.current < length:
             self.start = self.current
             self._scanToken()
 
@@ -36,96 +59,133 @@ class Scanner:
         return self.tokens
 
     def _scanToken(self):
-        c = self.advance()
-        match c:
-            # Simple single character tokens
-            case "(" | ")" | "{" | "}" | "," | "." | "-" | "+" | ";" | "*": self.addToken(TOKEN_MAP[c])
-            # Potential double character tokens
-            case "!": self.addToken(TokenType.BANG_EQUAL) if self.match("=") else self.addToken(TOKEN_MAP[c])
-            case "=": self.addToken(TokenType.EQUAL_EQUAL) if self.match("=") else self.addToken(TOKEN_MAP[c])
-            case "<": self.addToken(TokenType.LESS_EQUAL) if self.match("=") else self.addToken(TOKEN_MAP[c])
-            case ">": self.addToken(TokenType.GREATER_EQUAL) if self.match("=") else self.addToken(TOKEN_MAP[c])
-            case "/": 
-                if self.match("/"):
-                    # In this case, a comment has been detected, which goes until the end of the line
-                    # Comments are ignored while parsing
-                    while self.peek() != "\n" and not self.isAtEnd():
-                        self.advance()
-                else:
-                    self.addToken(TOKEN_MAP[c])
-            # Ignore whitespace
-            case " " | "\r" | "\t": ...
-            case "\n": self.line += 1
-            case "\"": self.string()
-            case val if is_num(val): self.number()
-            case chr if is_alpha(chr): self.identifier()
-            case _: lox.Lox.error(Token(TokenType.ERR, "", None, self.line), "Unexpected character...")
+        # Dispatch on the leading character through a table (defined at the
+        # end of the class, like the parser's predictive tables): one dict
+        # probe replaces the old match statement's sequential pattern tests
+        # and its regex guards for digits/letters
+        c = self.source[self.current]
+        self.current += 1
+        handler = Scanner._CHAR_DISPATCH.get(c)
+        if handler is not None:
+            handler(self)
+        else:
+            lox.Lox.error(Token(TokenType.ERR, "", None, self.line), "Unexpected character...")
+
+    def _whitespace(self):
+        # Whitespace produces nothing; consume the rest of the run in one
+        # regex step (the first character was already taken by _scanToken)
+        self.current = _WS_RE.match(self.source, self.current).end()
+
+    def _newline(self):
+        self.line += 1
+
+    # The two-character operator handlers inline match("="): one bounds check
+    # and one compare, without the extra method call per operator
+
+    def _bang(self):
+        if self.current < self.length and self.source[self.current] == "=":
+            self.current += 1
+            self.addToken(TokenType.BANG_EQUAL)
+        else:
+            self.addToken(TokenType.BANG)
+
+    def _equal(self):
+        if self.current < self.length and self.source[self.current] == "=":
+            self.current += 1
+            self.addToken(TokenType.EQUAL_EQUAL)
+        else:
+            self.addToken(TokenType.EQUAL)
+
+    def _less(self):
+        if self.current < self.length and self.source[self.current] == "=":
+            self.current += 1
+            self.addToken(TokenType.LESS_EQUAL)
+        else:
+            self.addToken(TokenType.LESS)
+
+    def _greater(self):
+        if self.current < self.length and self.source[self.current] == "=":
+            self.current += 1
+            self.addToken(TokenType.GREATER_EQUAL)
+        else:
+            self.addToken(TokenType.GREATER)
+
+    def _slash(self):
+        if self.current < self.length and self.source[self.current] == "/":
+            self.current += 1
+            # In this case, a comment has been detected, which goes until the end of the line
+            # Comments are ignored while parsing; skip to the newline in one
+            # C-level search (the newline itself is left for the next scan
+            # step, which counts the line)
+            index = self.source.find("\n", self.current)
+            self.current = self.length if index < 0 else index
+        else:
+            self.addToken(TokenType.SLASH)
 
     def identifier(self):
-        # Consume tokens until you get to a non-alphanumeric
-        while is_alnum(self.peek()): self.advance()
-        # Then check if the max-munched value is a keyword, otherwise interpret as identifier
-        text = self.source[self.start:self.current]
+        # Consume up to the first non-alphanumeric in one regex step
+        self.current = _IDENT_RE.match(self.source, self.current).end()
+        # Then check if the max-munched value is a keyword, otherwise interpret as identifier.
+        # Identifiers and keywords repeat a lot, so intern the lexeme: every occurrence of the
+        # same name shares one str object and dict lookups on it hit the pointer-equality fast path.
+        text = intern(self.source[self.start:self.current])
         token_type = KEYWORDS.get(text, TokenType.IDENTIFIER)
-        self.addToken(token_type)
+        self.tokens.append(Token(
+            token_type=token_type,
+            lexeme=text,
+            literal=None,
+            line=self.line
+        ))
 
     def number(self):
-        while is_num(self.peek()):
-            self.advance()
-        # Check if it is a decimal number and consume the dot if so
-        if self.peek() == "." and is_num(self.peekNext()):
-            self.advance()
-        while is_num(self.peek()):
-            self.advance()
-
-        self.addTokenLiteral(TokenType.NUMBER, float(self.source[self.start:self.current]))
+        source = self.source
+        current = _DIGITS_RE.match(source, self.current).end()
+        # Check if it is a decimal number and consume the dot if so,
+        # plus the fractional digits in a second bulk step. The lookahead
+        # is inlined (one bounds check covers both characters)
+        if (
+            current + 1 < self.length
+            and source[current] == "."
+            and "0" <= source[current + 1] <= "9"
+        ):
+            current = _DIGITS_RE.match(source, current + 1).end()
+
+        self.current = current
+        self.addTokenLiteral(TokenType.NUMBER, float(source[self.start:current]))
 
     def string(self):
-        # keep going until the string terminates, or there are no more tokens left
-        while self.peek() != "\"" and not self.isAtEnd():
-            if self.peek() == "\n": 
-                self.line += 1
-            self.advance()
-            if self.isAtEnd(): 
-                lox.Lox.error(Token(TokenType.ERR, "", None, self.line), "Unterminated String")
-                return
-        
-        # Consume the terminating "
-        self.advance()
+        # Find the terminating quote in one search and count the newlines the
+        # string spans in a second; both run inside the str C implementation
+        source = self.source
+        end = source.find("\"", self.current)
+        if end < 0:
+            self.line += source.count("\n", self.current)
+            self.current = self.length
+            lox.Lox.error(Token(TokenType.ERR, "", None, self.line), "Unterminated String")
+            return
+        self.line += source.count("\n", self.current, end)
+
+        # Step past the terminating "
+        self.current = end + 1
 
         # Get the substring
-        self.addTokenLiteral(TokenType.STRING, self.source[self.start+1:self.current-1])
+        self.addTokenLiteral(TokenType.STRING, source[self.start+1:self.current-1])
             
-    def match(self, expected: str) -> bool:
-        # Used for matching the next character after a potential 2-character token has been detected
-        # If the match succeeds, consume the token (by advancing the current pointer) and return True
-        # Similar to advance, but conditional on whether the match succeeds.
-        if self.isAtEnd(): return False
-        if self.source[self.current] != expected: return False
-        self.current += 1
-        return True
-    
-    def peek(self) -> Char:
-        # Non consuming version of advance
-        # lookahead for checking next character
-        if self.isAtEnd():
-            return '\0'
-        return self.source[self.current]
-    
-    def peekNext(self) -> Char:
-        # two character lookahead
-        if self.current + 1 > len(self.source): return "\0"
-        return self.source[self.current+1]
-
-    def isAtEnd(self):
-        return self.current >= len(self.source)
-    
-    def advance(self) -> Char:
-        self.current += 1
-        return self.source[self.current-1]
-    
     def addToken(self, token_type: TokenType):
-        self.addTokenLiteral(token_type, None)
+        # Operators and punctuation only come through here (identifiers,
+        # numbers and strings build their tokens directly), so reuse one
+        # Token per (type, line) instead of allocating per occurrence
+        key = (token_type, self.line)
+        token = self._op_tokens.get(key)
+        if token is None:
+            token = Token(
+                token_type=token_type,
+                lexeme=self.source[self.start:self.current],
+                literal=None,
+                line=self.line
+            )
+            self._op_tokens[key] = token
+        self.tokens.append(token)
 
     def addTokenLiteral(self, token_type: TokenType, literal: Any):
         # Grab the full lexeme (trivial for single and double character lexemes)
@@ -137,4 +197,37 @@ class Scanner:
             lexeme=text,
             literal=literal,
             line=self.line
-        ))
\ No newline at end of file
+        ))
+
+    ############ Character dispatch table. Defined last so the plain method
+    # references above resolve; the single-character tokens get one small
+    # lambda each, and the digit/letter ranges all share the number/identifier
+    # handlers so no per-character classification guard runs in _scanToken.
+
+    _CHAR_DISPATCH = {
+        "(": lambda self: self.addToken(TokenType.LEFT_PAREN),
+        ")": lambda self: self.addToken(TokenType.RIGHT_PAREN),
+        "{": lambda self: self.addToken(TokenType.LEFT_BRACE),
+        "}": lambda self: self.addToken(TokenType.RIGHT_BRACE),
+        ",": lambda self: self.addToken(TokenType.COMMA),
+        ".": lambda self: self.addToken(TokenType.DOT),
+        "-": lambda self: self.addToken(TokenType.MINUS),
+        "+": lambda self: self.addToken(TokenType.PLUS),
+        ";": lambda self: self.addToken(TokenType.SEMICOLON),
+        "*": lambda self: self.addToken(TokenType.STAR),
+        "!": _bang,
+        "=": _equal,
+        "<": _less,
+        ">": _greater,
+        "/": _slash,
+        " ": _whitespace,
+        "\r": _whitespace,
+        "\t": _whitespace,
+        "\n": _newline,
+        "\"": string,
+    }
+    for _ch in "0123456789":
+        _CHAR_DISPATCH[_ch] = number
+    for _ch in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_":
+        _CHAR_DISPATCH[_ch] = identifier
+    del _ch
@@ -1,8 +1,11 @@
-from pydantic.dataclasses import dataclass
+from dataclasses import dataclass
 
 from .token_type import TokenType
 
-@dataclass(eq=True, frozen=True)
+# A plain (slotted) dataclass rather than a pydantic one: the scanner builds
+# one Token per lexeme on a trusted internal path, so per-field validation was
+# pure overhead, and slots drop the per-instance __dict__.
+@dataclass(eq=True, slots=True)
 class Token:
 
     token_type: TokenType
@@ -11,4 +14,4 @@ class Token:
     line: int
 
     def __str__(self):
-        return f"[Line {self.line}] {self.token_type} => {self.lexeme}, {self.literal}"
\ No newline at end of file
+        return f"[Line {self.line}] {self.token_type} => {self.lexeme}, {self.literal}"
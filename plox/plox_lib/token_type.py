@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import IntEnum
 
 # All tokens in the Lox language, each line has a category of tokens
 # 1. Single-character tokens
@@ -6,7 +6,8 @@ from enum import Enum
 # 3. Literals
 # 4. Keywords
 # 5. EOF token
-TokenType = Enum("TokenType", """
+# IntEnum so hot-path comparisons and dict probes hash/compare as plain ints
+TokenType = IntEnum("TokenType", """
 LEFT_PAREN RIGHT_PAREN LEFT_BRACE RIGHT_BRACE COMMA DOT MINUS PLUS SEMICOLON SLASH STAR
 BANG BANG_EQUAL EQUAL EQUAL_EQUAL GREATER GREATER_EQUAL LESS LESS_EQUAL
 IDENTIFIER STRING NUMBER
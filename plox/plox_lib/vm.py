@@ -0,0 +1,236 @@
+from .token import Token
+from .error import LoxRuntimeError
+from .lox_callable import LoxCallable
+from .compiler import (
+    Chunk,
+    OP_LOAD_CONST, OP_NIL, OP_LOAD_LOCAL, OP_STORE_LOCAL, OP_DEFINE_LOCAL,
+    OP_GET_GLOBAL, OP_SET_GLOBAL, OP_DEFINE_GLOBAL,
+    OP_ADD, OP_SUB, OP_MUL, OP_DIV, OP_LT, OP_LE, OP_GT, OP_GE, OP_EQ, OP_NEQ,
+    OP_NEGATE, OP_NOT, OP_JUMP, OP_JUMP_IF_FALSE, OP_JUMP_IF_FALSE_NP,
+    OP_POP, OP_PRINT, OP_PUSH_SCOPE, OP_POP_SCOPE,
+    OP_MAKE_FUNCTION, OP_CALL, OP_RETURN,
+)
+
+import time
+
+
+class Scope:
+    """One level of the runtime scope chain: indexed slots instead of a name dict."""
+
+    __slots__ = ("slots", "parent")
+
+    def __init__(self, parent: "Scope | None" = None, slots: "list[object] | None" = None):
+        self.slots: list[object] = slots if slots is not None else []
+        self.parent: Scope | None = parent
+
+
+class VmFunction:
+    """A compiled Lox function closing over the scope it was declared in."""
+
+    __slots__ = ("chunk", "scope")
+
+    def __init__(self, chunk: Chunk, scope: Scope | None):
+        self.chunk: Chunk = chunk
+        self.scope: Scope | None = scope
+
+    def __repr__(self) -> str:
+        return f"<fn {self.chunk.name} >"
+
+
+class Frame:
+    """A call frame: the chunk being executed, its instruction pointer and scope."""
+
+    __slots__ = ("chunk", "ip", "scope", "stack_base")
+
+    def __init__(self, chunk: Chunk, scope: Scope | None, stack_base: int):
+        self.chunk: Chunk = chunk
+        self.ip: int = 0
+        self.scope: Scope | None = scope
+        self.stack_base: int = stack_base
+
+
+def isTruthy(value: object) -> bool:
+    """Same truthiness rules as the tree-walking interpreter: {False, nil} are falsey."""
+    return value is not None and value is not False
+
+
+def stringify(value: object) -> str:
+    if value is None:
+        return "nil"
+    if isinstance(value, (float, int)):
+        return f"{value:g}"
+    return str(value)
+
+
+class Clock(LoxCallable):
+    def arity(self) -> int:
+        return 0
+
+    def call(self, interpreter, arguments: list[object]) -> object:
+        return int(time.time_ns() / 1_000_000)
+
+    def __repr__(self) -> str:
+        return f"<fn clock (builtin)>"
+
+
+class VM:
+    """
+    Stack machine over the flat opcode stream produced by Compiler. One Python
+    'while' iteration per instruction and a 'match' over small ints, instead of
+    a Python frame plus virtual dispatch per AST node in the tree-walker.
+    """
+
+    def __init__(self):
+        self.globals: dict[str, object] = {"clock": Clock()}
+
+    def run(self, chunk: Chunk) -> None:
+        stack: list[object] = []
+        frame = Frame(chunk, None, 0)
+        frames: list[Frame] = [frame]
+        code = chunk.code
+        ip = 0
+
+        while True:
+            op = code[ip]
+            ip += 1
+            match op:
+                case 0:  # OP_LOAD_CONST
+                    stack.append(frame.chunk.consts[code[ip]])
+                    ip += 1
+                case 2:  # OP_LOAD_LOCAL
+                    depth, slot = code[ip], code[ip + 1]
+                    ip += 2
+                    scope = frame.scope
+                    for _ in range(depth):
+                        scope = scope.parent  # type: ignore
+                    stack.append(scope.slots[slot])  # type: ignore
+                case 3:  # OP_STORE_LOCAL
+                    depth, slot = code[ip], code[ip + 1]
+                    ip += 2
+                    scope = frame.scope
+                    for _ in range(depth):
+                        scope = scope.parent  # type: ignore
+                    scope.slots[slot] = stack[-1]  # type: ignore
+                case 4:  # OP_DEFINE_LOCAL
+                    frame.scope.slots.append(stack.pop())  # type: ignore
+                case 5:  # OP_GET_GLOBAL
+                    name = frame.chunk.names[code[ip]]
+                    if name not in self.globals:
+                        raise LoxRuntimeError(frame.chunk.tokens[code[ip + 1]], f"Undefined variable '{name}'.")
+                    stack.append(self.globals[name])
+                    ip += 2
+                case 6:  # OP_SET_GLOBAL
+                    name = frame.chunk.names[code[ip]]
+                    if name not in self.globals:
+                        raise LoxRuntimeError(frame.chunk.tokens[code[ip + 1]], f"Undefined variable '{name}'.")
+                    self.globals[name] = stack[-1]
+                    ip += 2
+                case 7:  # OP_DEFINE_GLOBAL
+                    self.globals[frame.chunk.names[code[ip]]] = stack.pop()
+                    ip += 1
+                case 8:  # OP_ADD
+                    right = stack.pop()
+                    left = stack.pop()
+                    if isinstance(left, float) and isinstance(right, float):
+                        stack.append(left + right)
+                    elif isinstance(left, str) and isinstance(right, str):
+                        stack.append(left + right)
+                    elif isinstance(left, (float, int, str)) and isinstance(right, (float, int, str)):
+                        # Allow mixed expressions and interpret as strings
+                        stack.append(str(left) + str(right))
+                    else:
+                        raise LoxRuntimeError(frame.chunk.tokens[code[ip]], "Operands must be two numbers or two strings")
+                    ip += 1
+                case 9 | 10 | 11 | 12 | 13 | 14 | 15:  # numeric binary ops
+                    right = stack.pop()
+                    left = stack.pop()
+                    if not (isinstance(left, float) and isinstance(right, float)):
+                        raise LoxRuntimeError(frame.chunk.tokens[code[ip]], "Operands must be a number")
+                    ip += 1
+                    match op:
+                        case 9: stack.append(left - right)
+                        case 10: stack.append(left * right)
+                        case 11: stack.append(left / right)
+                        case 12: stack.append(left < right)
+                        case 13: stack.append(left <= right)
+                        case 14: stack.append(left > right)
+                        case 15: stack.append(left >= right)
+                case 16:  # OP_EQ
+                    right = stack.pop()
+                    left = stack.pop()
+                    # Same operand gate as the tree-walker's visitBinaryExpr:
+                    # comparisons on anything but float/str/bool yield nil
+                    if isinstance(left, (float, str, bool)) and isinstance(right, (float, str, bool)):
+                        stack.append(left == right)
+                    else:
+                        stack.append(None)
+                    ip += 1
+                case 17:  # OP_NEQ
+                    right = stack.pop()
+                    left = stack.pop()
+                    if isinstance(left, (float, str, bool)) and isinstance(right, (float, str, bool)):
+                        stack.append(left != right)
+                    else:
+                        stack.append(None)
+                    ip += 1
+                case 18:  # OP_NEGATE
+                    value = stack.pop()
+                    if not isinstance(value, float):
+                        raise LoxRuntimeError(frame.chunk.tokens[code[ip]], "Operand must be a number")
+                    stack.append(-value)
+                    ip += 1
+                case 19:  # OP_NOT
+                    stack.append(not isTruthy(stack.pop()))
+                case 20:  # OP_JUMP
+                    ip = code[ip]
+                case 21:  # OP_JUMP_IF_FALSE
+                    ip = code[ip] if not isTruthy(stack.pop()) else ip + 1
+                case 22:  # OP_JUMP_IF_FALSE_NP
+                    ip = code[ip] if not isTruthy(stack[-1]) else ip + 1
+                case 1:  # OP_NIL
+                    stack.append(None)
+                case 23:  # OP_POP
+                    stack.pop()
+                case 24:  # OP_PRINT
+                    print(stringify(stack.pop()))
+                case 25:  # OP_PUSH_SCOPE
+                    frame.scope = Scope(frame.scope)
+                case 26:  # OP_POP_SCOPE
+                    frame.scope = frame.scope.parent  # type: ignore
+                case 27:  # OP_MAKE_FUNCTION
+                    stack.append(VmFunction(frame.chunk.consts[code[ip]], frame.scope))  # type: ignore
+                    ip += 1
+                case 28:  # OP_CALL
+                    argc = code[ip]
+                    callee = stack[-argc - 1]
+                    if isinstance(callee, VmFunction):
+                        if argc != callee.chunk.arity:
+                            raise LoxRuntimeError(frame.chunk.tokens[code[ip + 1]],
+                                                  f"Expected {callee.chunk.arity} arguments, but got {argc}.")
+                        frame.ip = ip + 2
+                        args = stack[len(stack) - argc:]
+                        del stack[len(stack) - argc - 1:]
+                        frame = Frame(callee.chunk, Scope(callee.scope, args), len(stack))
+                        frames.append(frame)
+                        code = frame.chunk.code
+                        ip = 0
+                    elif isinstance(callee, LoxCallable):
+                        if argc != callee.arity():
+                            raise LoxRuntimeError(frame.chunk.tokens[code[ip + 1]],
+                                                  f"Expected {callee.arity()} arguments, but got {argc}.")
+                        args = stack[len(stack) - argc:]
+                        del stack[len(stack) - argc - 1:]
+                        stack.append(callee.call(self, args))
+                        ip += 2
+                    else:
+                        raise LoxRuntimeError(frame.chunk.tokens[code[ip + 1]], "Can only call functions and classes.")
+                case 29:  # OP_RETURN
+                    result = stack.pop()
+                    frames.pop()
+                    if not frames:
+                        return
+                    del stack[frame.stack_base:]
+                    frame = frames[-1]
+                    code = frame.chunk.code
+                    ip = frame.ip
+                    stack.append(result)
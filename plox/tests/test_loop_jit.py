@@ -0,0 +1,32 @@
+from plox_lib import Scanner, Parser, Token
+from plox_lib.interpreter import Interpreter
+from plox_lib.resolver import Resolver
+
+
+def run(source: str):
+    scanner = Scanner(source)
+    tokens: list[Token] = scanner.scanTokens()
+    parser = Parser(tokens)
+    statements = parser.parse()
+    interpreter = Interpreter()
+    resolver = Resolver(interpreter)
+    resolver.resolveStatements(statements)
+    interpreter.interpret(statements)
+
+
+def test_arithmetic_loop_is_lowered(capsys):
+    run("""
+var total = 0;
+var i = 0;
+while (i < 1000) {
+    total = total + i * 2;
+    i = i + 1;
+}
+print total;
+""")
+    assert capsys.readouterr().out == "999000\n"
+
+
+def test_loop_with_side_effects_falls_back(capsys):
+    run("var i = 0; while (i < 3) { print i; i = i + 1; }")
+    assert capsys.readouterr().out == "0\n1\n2\n"
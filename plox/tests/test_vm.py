@@ -0,0 +1,50 @@
+from plox_lib import Scanner, Parser, Token
+from plox_lib.compiler import Compiler
+from plox_lib.vm import VM
+
+
+def run_on_vm(source: str):
+    scanner = Scanner(source)
+    tokens: list[Token] = scanner.scanTokens()
+    parser = Parser(tokens)
+    statements = parser.parse()
+    chunk = Compiler().compile(statements)
+    VM().run(chunk)
+
+
+def test_print_arithmetic(capsys):
+    run_on_vm("print 1 + 2 * 3;")
+    assert capsys.readouterr().out == "7\n"
+
+
+def test_while_loop(capsys):
+    run_on_vm("var i = 0; while (i < 3) { print i; i = i + 1; }")
+    assert capsys.readouterr().out == "0\n1\n2\n"
+
+
+def test_function_call(capsys):
+    run_on_vm("""
+fun fib(n) {
+    if (n <= 1) return n;
+    return fib(n - 2) + fib(n - 1);
+}
+print fib(10);
+""")
+    assert capsys.readouterr().out == "55\n"
+
+
+def test_closure(capsys):
+    run_on_vm("""
+fun makeCounter() {
+    var i = 0;
+    fun count() {
+        i = i + 1;
+        print i;
+    }
+    return count;
+}
+var counter = makeCounter();
+counter();
+counter();
+""")
+    assert capsys.readouterr().out == "1\n2\n"
@@ -1,18 +1,21 @@
 from pathlib import Path
 
 def generate_ast_file(base_name: str,
-                       data: list[str], 
-                       additional_imports: list[str] = []):
+                       data: list[str],
+                       additional_imports: list[str] = [],
+                       annotation_slots: list[str] = []):
     """
     Creates a file plox_lib/asts/<base_name>.py with AST definitions described by <data>.
     The following format is expected:
         ["<class_name> - <field_name: type, >",]
     The <additional_imports> field is to make sure the trees can refer to each other, without
     running into circular imports.
+    The <annotation_slots> are extra slot names on the base class for attributes that the
+    Resolver/Interpreter attach after construction (the nodes carry no __dict__).
 
     See the "if __name__ is "__main__":" block below for examples.
     """
-    
+
     lines = [
         "# THIS FILE WAS GENERATED BY 'tool/ast.py' DO NOT MODIFY",
         "",
@@ -25,10 +28,14 @@ def generate_ast_file(base_name: str,
 
     lines += _define_visitor(base_name, data)
 
+    slots = ", ".join(f'"{slot}"' for slot in annotation_slots)
     lines += [
-        "# Required to be frozen and eq since they are used as keys in dicts and need to be hashable",
+        "# Nodes are slotted: no per-instance __dict__, fields are direct slot reads.",
+        "# The base class reserves slots for annotations attached after construction.",
         "@dataclass(eq=True, frozen=True)",
         f"class {base_name}:",
+        f"\t__slots__ = ({slots}{',' if annotation_slots else ''})",
+        "",
         "\t@abstractmethod",
         "\tdef accept(self, visitor: Visitor) -> Any: ...",
         "",
@@ -43,7 +50,7 @@ def generate_ast_file(base_name: str,
 
 def _generate_ast_class(base_class: str, class_name: str, description: str) -> list[str]:
     lines = [
-        "@dataclass(eq=True, frozen=True)",
+        "@dataclass(eq=True, frozen=True, slots=True)",
         f"class {class_name}({base_class}):",
     ]
 
@@ -61,7 +68,9 @@ def _generate_ast_class(base_class: str, class_name: str, description: str) -> l
     return lines + [""]
 
 def _define_visitor(base_name: str, description) -> list[str]:
-    lines = ["T = TypeVar(\"T\")", "", "class Visitor(ABC, Generic[T]):"]
+    # Empty slots on the base: visitors declare their own __slots__ and would
+    # otherwise inherit a __dict__ from here, defeating them
+    lines = ["T = TypeVar(\"T\")", "", "class Visitor(ABC, Generic[T]):", "\t__slots__ = ()"]
 
     for item in description:
         type_name, _ = map(str.strip, item.split("-", 1))
@@ -85,7 +94,8 @@ if __name__ == "__main__":
         "This     - keyword: Token",
         "Unary    - operator: Token, right: Expr",
         "Variable - name: Token",
-    ])
+    ],
+    annotation_slots=["str_cached", "_methodCache", "numeric_fast", "resolved", "op_fn", "fused_delta"])
 
     generate_ast_file("Stmt", [
         "Block      - statements: list[Stmt]",
@@ -98,4 +108,5 @@ if __name__ == "__main__":
         "Var        - name: Token, initializer: Expr | None",
         "While      - condition: Expr, body: Stmt",
     ],
-    ["from .expr import Expr, Variable"])
\ No newline at end of file
+    ["from .expr import Expr, Variable"],
+    annotation_slots=["num_locals", "slot", "_loop_fn"])
\ No newline at end of file
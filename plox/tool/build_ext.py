@@ -0,0 +1,47 @@
+"""
+Optional: compile the hot runtime modules with Cython.
+
+Cython compiles the existing pure-Python sources directly (no .pyx fork to
+keep in sync), which removes CPython's bytecode dispatch for the evaluate/
+execute loop and gives C-level attribute access on the runtime classes.
+Requires Cython and a C compiler; the interpreter runs unchanged without
+either, since Python prefers an adjacent .so over the .py when one exists.
+
+Usage (from the plox directory):
+    pip install cython
+    python tool/build_ext.py build_ext --inplace
+
+Remove the generated .so/.c files to go back to pure Python.
+"""
+
+from pathlib import Path
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError as err:
+    raise SystemExit("Cython is not installed; run 'pip install cython' first.") from err
+
+PLOX = Path(__file__).resolve().parent.parent
+
+# The modules on the hot path; only the AST definitions are left interpreted.
+# The front-end passes (scanner/parser/resolver) run once per script but are
+# all O(source) loops of small int/char compares and dict probes — exactly the
+# shape Cython strips bytecode dispatch from.
+HOT_MODULES = [
+    "plox_lib/interpreter.py",
+    "plox_lib/environment.py",
+    "plox_lib/lox_function.py",
+    "plox_lib/lox_class.py",
+    "plox_lib/lox_instance.py",
+    "plox_lib/scanner.py",
+    "plox_lib/parser.py",
+    "plox_lib/resolver.py",
+]
+
+setup(
+    ext_modules=cythonize(
+        [str(PLOX / module) for module in HOT_MODULES],
+        language_level=3,
+    ),
+)